@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     newsapi_language: str = "en"
     newsapi_sort_by: str = "relevancy"  # relevancy, popularity, publishedAt
     newsapi_lookback_days: int = 30  # Free tier: max 30 days (paid plans: up to years)
+    newsapi_max_concurrent_requests: int = 5  # Parallel page fetches after the first page
 
     # Yahoo Finance (via yfinance - no API key required)
     finance_lookback_years: int = 10  # Historical data lookback period
@@ -67,6 +68,9 @@ class Settings(BaseSettings):
     hype_cycle_min_reddit_posts_for_analysis: int = 10  # minimum reddit posts needed
     hype_cycle_min_news_articles_for_analysis: int = 10  # minimum news articles needed
     hype_cycle_min_finance_records_for_analysis: int = 20  # minimum finance records needed
+    hype_cycle_news_metrics_cache_ttl_seconds: int = 86400  # reuse unchanged news metrics (0 = disabled)
+    hype_cycle_paper_metrics_cache_ttl_seconds: int = 86400  # reuse unchanged paper metrics (0 = disabled)
+    hype_cycle_patent_metrics_cache_ttl_seconds: int = 86400  # reuse unchanged patent metrics (0 = disabled)
 
     class Config:
         env_file = ".env"
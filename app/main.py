@@ -23,7 +23,7 @@ from .schemas import (
 from .services.semantic_scholar_collector import SemanticScholarCollector
 from .services.patents_view_collector import PatentsViewCollector
 from .services.reddit_collector import RedditCollector
-from .services.news_collector import NewsCollector
+from .services.news_collector import NewsCollector, close_newsapi_client
 from .services.yahoo_finance_collector import YahooFinanceCollector
 from .services.paper_metrics_calculator import PaperMetricsCalculator
 from .services.patent_metrics_calculator import PatentMetricsCalculator
@@ -55,6 +55,12 @@ app = FastAPI(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    """Close shared HTTP clients"""
+    await close_newsapi_client()
+
+
 @app.get("/", tags=["Root"])
 def read_root():
     """Root endpoint - API status"""
@@ -951,7 +957,7 @@ async def analyze_patents_for_hype_cycle(
         patent_metrics_with_phase['patent_phase'] = phase.value
         patent_metrics_with_phase['patent_phase_confidence'] = confidence
         patent_metrics_with_phase['patent_phase_scores'] = phase_scores
-        patent_metrics_with_phase['patent_rationale'] = rationale
+        patent_metrics_with_phase['patent_rationale'] = str(rationale)
 
         if existing_analysis:
             # Update existing with patent metrics
@@ -984,9 +990,9 @@ async def analyze_patents_for_hype_cycle(
             current_phase=phase.value,
             phase_confidence=confidence,
             phase_scores=phase_scores,
-            rationale=rationale,
+            rationale=patent_metrics_with_phase['patent_rationale'],
             patent_velocity=metrics.patent_velocity,
-            velocity_trend=metrics.velocity_trend,
+            velocity_trend=str(metrics.velocity_trend),
             avg_patents_per_year=metrics.avg_patents_per_year,
             peak_year=metrics.peak_year,
             peak_count=metrics.peak_count,
@@ -1214,7 +1220,7 @@ async def analyze_news_for_hype_cycle(
             current_phase=phase.value,
             phase_confidence=confidence,
             phase_scores=phase_scores,
-            rationale=rationale,
+            rationale=str(rationale),
             article_velocity=metrics.article_velocity,
             velocity_trend=metrics.velocity_trend,
             avg_articles_per_month=metrics.avg_articles_per_month,
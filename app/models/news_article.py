@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import json
@@ -15,7 +15,7 @@ class NewsArticle(Base):
     technology_id = Column(Integer, ForeignKey("technologies.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # NewsAPI fields - Basic
-    article_id = Column(String(100), nullable=False, index=True)  # MD5 hash of URL
+    article_id = Column(LargeBinary(16), nullable=False, index=True)  # Raw BLAKE2b-128 digest of URL
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     content = Column(Text, nullable=True)  # Full content (truncated to 200 chars on free tier)
@@ -55,4 +55,4 @@ class NewsArticle(Base):
             self._source = json.dumps(value)
 
     def __repr__(self):
-        return f"<NewsArticle(id={self.id}, article_id='{self.article_id}', title='{self.title[:50]}...')>"
+        return f"<NewsArticle(id={self.id}, article_id='{self.article_id.hex()}', title='{self.title[:50]}...')>"
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Inde
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import json
+import orjson
 
 from ..database import Base
 
@@ -45,7 +46,7 @@ class Patent(Base):
     def assignees(self):
         """Get assignees as Python list"""
         if self._assignees:
-            return json.loads(self._assignees)
+            return orjson.loads(self._assignees)
         return []
 
     @assignees.setter
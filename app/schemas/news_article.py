@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -15,6 +15,14 @@ class NewsArticleBase(BaseModel):
     author: Optional[str] = Field(None, max_length=500, description="Article author(s)")
     source: Optional[Dict[str, Any]] = Field(None, description="Source metadata")
 
+    @field_validator("article_id", mode="before")
+    @classmethod
+    def article_id_to_hex(cls, value):
+        """Article IDs are stored as raw digest bytes; expose them as hex"""
+        if isinstance(value, bytes):
+            return value.hex()
+        return value
+
 
 class NewsArticleCreate(NewsArticleBase):
     """Schema for creating a new news article"""
@@ -1,16 +1,24 @@
-from typing import Dict, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+from dataclasses import dataclass, asdict, astuple
+from functools import lru_cache
+import heapq
+import numpy as np
 import logging
 
 from ..models.hype_cycle_phase import HypeCyclePhase, PhaseCharacteristics
-from .paper_metrics_calculator import MetricsSnapshot
+from .paper_metrics_calculator import MetricsSnapshot, VelocityTrend, ResearchTypeTrend
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleThresholds:
-    """Configurable thresholds for rule evaluation"""
+    """
+    Configurable thresholds for rule evaluation
+
+    Immutable: engines inline the values into their compiled rule predicates, so a
+    different threshold set needs a new RuleThresholds and engine.
+    """
 
     # Velocity thresholds
     velocity_growth_threshold: float = 20.0  # % increase = increasing
@@ -34,11 +42,102 @@ class RuleThresholds:
     high_confidence_threshold: float = 0.8
 
 
+# Phase order shared by the rows of the rule weight matrix
+PHASE_ORDER = (
+    HypeCyclePhase.TECHNOLOGY_TRIGGER,
+    HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS,
+    HypeCyclePhase.TROUGH_DISILLUSIONMENT,
+    HypeCyclePhase.SLOPE_ENLIGHTENMENT,
+    HypeCyclePhase.PLATEAU_PRODUCTIVITY,
+)
+
+# Weight of each rule (columns, in HypeCycleRuleEngine._rule_features order) per phase (rows)
+RULE_WEIGHTS = np.array([
+    # Technology Trigger: early growth, basic research, low citations, academic venues, low recent activity
+    [0.3, 0.25, 0.2, 0.15, 0.1] + [0.0] * 17,
+    # Peak of Inflated Expectations: recent peak, citation growth, shift to applied, high velocity
+    [0.0] * 5 + [0.3, 0.25, 0.25, 0.2] + [0.0] * 13,
+    # Trough of Disillusionment: declining velocity, peak 1-3 years ago, low citation growth, below peak
+    [0.0] * 9 + [0.35, 0.3, 0.2, 0.15] + [0.0] * 9,
+    # Slope of Enlightenment: applied research, stable growth, moderate citation growth, peak 4-7 years ago
+    [0.0] * 13 + [0.3, 0.25, 0.25, 0.2] + [0.0] * 5,
+    # Plateau of Productivity: very applied, stable velocity, high citations, industry venues, old peak
+    [0.0] * 17 + [0.35, 0.25, 0.2, 0.1, 0.1],
+])
+N_RULES = RULE_WEIGHTS.shape[1]
+
+# Phase metadata resolved once per process for rationale generation
+_PHASE_INFO = PhaseCharacteristics.PHASE_DEFINITIONS
+_PHASE_NAME: Dict[HypeCyclePhase, str] = {p: _PHASE_INFO[p]["name"] for p in HypeCyclePhase}
+
+# Rule predicates in RULE_WEIGHTS column order; {threshold} fields are inlined per RuleThresholds
+_RULE_FEATURES_SOURCE = """
+def rule_features(m):
+    years_since_peak = m.years_since_peak if m.publication_velocity else None
+
+    # Recent activity relatively low compared to total (expected: two average years)
+    recent_activity_low = bool(m.publication_velocity) and m.papers_last_2_years < 2 * m.avg_papers_per_year
+
+    return [
+        # Technology Trigger
+        m.velocity_trend == VelocityTrend.INCREASING and m.growth_rate_early_vs_late > 50,
+        m.basic_research_percentage > {basic_research_high!r},
+        m.avg_citations_per_paper < 20,
+        m.academic_venue_percentage > 90,
+        recent_activity_low,
+
+        # Peak of Inflated Expectations
+        years_since_peak is not None and years_since_peak <= {peak_recency_years!r},
+        m.citation_growth_rate > {citation_growth_high!r},
+        40 <= m.applied_research_percentage <= 60 and m.research_type_trend == ResearchTypeTrend.TOWARD_APPLIED,
+        m.velocity_trend in (VelocityTrend.INCREASING, VelocityTrend.PEAK_REACHED),
+
+        # Trough of Disillusionment
+        m.velocity_trend == VelocityTrend.DECREASING,
+        years_since_peak is not None and 1 <= years_since_peak <= 3,
+        m.citation_growth_rate < {citation_growth_moderate!r},
+        m.papers_last_year < m.peak_count * 0.7,
+
+        # Slope of Enlightenment
+        {applied_research_high!r} <= m.applied_research_percentage < {applied_research_very_high!r},
+        m.velocity_trend in (VelocityTrend.STABLE, VelocityTrend.INCREASING) and m.growth_rate_early_vs_late > 0,
+        {citation_growth_moderate!r} <= m.citation_growth_rate < {citation_growth_high!r},
+        years_since_peak is not None and 4 <= years_since_peak <= 7,
+
+        # Plateau of Productivity
+        m.applied_research_percentage > {applied_research_very_high!r},
+        m.velocity_trend == VelocityTrend.STABLE,
+        m.avg_citations_per_paper > 50,
+        m.industry_venue_percentage > 30,
+        years_since_peak is not None and years_since_peak >= 8,
+    ]
+"""
+
+
+@lru_cache(maxsize=32)
+def _compile_rule_features(threshold_values: Tuple) -> Callable[[MetricsSnapshot], List[bool]]:
+    """
+    Compile the rule predicates specialized for one threshold set
+
+    Args:
+        threshold_values: RuleThresholds field values (astuple), used as cache key
+
+    Returns:
+        Function mapping a MetricsSnapshot to its rule outcomes
+    """
+    source = _RULE_FEATURES_SOURCE.format(**asdict(RuleThresholds(*threshold_values)))
+    namespace = {"VelocityTrend": VelocityTrend, "ResearchTypeTrend": ResearchTypeTrend}
+    exec(compile(source, "<hype_cycle_rule_features>", "exec"), namespace)
+    return namespace["rule_features"]
+
+
 class HypeCycleRuleEngine:
     """Rule-based engine for determining Hype Cycle phase"""
 
     def __init__(self, thresholds: RuleThresholds = None):
         self.thresholds = thresholds or RuleThresholds()
+        # Rule predicates compiled with this engine's thresholds inlined as constants
+        self._rule_features = _compile_rule_features(astuple(self.thresholds))
 
     def determine_phase(self, metrics: MetricsSnapshot) -> Tuple[HypeCyclePhase, float, Dict, str]:
         """
@@ -50,211 +149,61 @@ class HypeCycleRuleEngine:
         Returns:
             Tuple of (phase, confidence, rule_scores, rationale)
         """
-        logger.info("Determining Hype Cycle phase from metrics...")
-
-        # Score each phase based on rules
-        phase_scores = {
-            HypeCyclePhase.TECHNOLOGY_TRIGGER: self._score_technology_trigger(metrics),
-            HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS: self._score_peak_inflated(metrics),
-            HypeCyclePhase.TROUGH_DISILLUSIONMENT: self._score_trough(metrics),
-            HypeCyclePhase.SLOPE_ENLIGHTENMENT: self._score_slope(metrics),
-            HypeCyclePhase.PLATEAU_PRODUCTIVITY: self._score_plateau(metrics)
-        }
-
-        # Find highest scoring phase
-        best_phase = max(phase_scores, key=phase_scores.get)
-        confidence = phase_scores[best_phase]
-
-        logger.info(f"Phase determined: {best_phase.value} (confidence: {confidence:.2f})")
-
-        # Generate rationale
-        rationale = self._generate_rationale(best_phase, metrics, phase_scores)
-
-        # Convert enum keys to strings for JSON serialization
-        phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
-
-        return best_phase, confidence, phase_scores_str, rationale
-
-    def _score_technology_trigger(self, m: MetricsSnapshot) -> float:
-        """
-        Score for Technology Trigger phase
-
-        Indicators:
-        - Rapid publication growth (early stage)
-        - High % basic research (>70%)
-        - Low average citations (papers too new)
-        - Academic venues dominant
-        """
-        score = 0.0
-
-        # Check if in early growth phase
-        if m.velocity_trend == "increasing" and m.growth_rate_early_vs_late > 50:
-            score += 0.3
-
-        # High basic research percentage
-        if m.basic_research_percentage > self.thresholds.basic_research_high:
-            score += 0.25
-
-        # Low citations (avg < 20)
-        if m.avg_citations_per_paper < 20:
-            score += 0.2
-
-        # Academic venues (>90%)
-        if m.academic_venue_percentage > 90:
-            score += 0.15
-
-        # Recent activity relatively low compared to total
-        years_span = len(m.publication_velocity)
-        if years_span > 0:
-            expected_recent = (len(m.publication_velocity) * m.avg_papers_per_year / years_span) * 2
-            if m.papers_last_2_years < expected_recent:
-                score += 0.1
-
-        return min(score, 1.0)
-
-    def _score_peak_inflated(self, m: MetricsSnapshot) -> float:
-        """
-        Score for Peak of Inflated Expectations
-
-        Indicators:
-        - At or near peak publication velocity
-        - Rapid citation growth
-        - Shift toward applied research (40-60%)
-        - Emerging keywords about breakthroughs
-        """
-        score = 0.0
-
-        # Check if at peak or just passed it
-        if m.publication_velocity:
-            current_year = max(m.publication_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if years_since_peak <= self.thresholds.peak_recency_years:
-                score += 0.3
-
-        # High citation growth rate
-        if m.citation_growth_rate > self.thresholds.citation_growth_high:
-            score += 0.25
-
-        # Mixed research types with increasing applied
-        if 40 <= m.applied_research_percentage <= 60 and m.research_type_trend == "toward_applied":
-            score += 0.25
-
-        # High publication velocity
-        if m.velocity_trend in ["increasing", "peak_reached"]:
-            score += 0.2
-
-        return min(score, 1.0)
-
-    def _score_trough(self, m: MetricsSnapshot) -> float:
-        """
-        Score for Trough of Disillusionment
+        return self.determine_phases_batch([metrics])[0]
 
-        Indicators:
-        - Declining publication velocity
-        - Stagnant citations
-        - Recent peak followed by decline
+    def determine_phases_batch(self, metrics_list: List[MetricsSnapshot]) -> List[Tuple[HypeCyclePhase, float, Dict, str]]:
         """
-        score = 0.0
-
-        # Declining velocity
-        if m.velocity_trend == "decreasing":
-            score += 0.35
-
-        # Peak was recent but velocity declining
-        if m.publication_velocity:
-            current_year = max(m.publication_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if 1 <= years_since_peak <= 3:
-                score += 0.3
-
-        # Low citation growth
-        if m.citation_growth_rate < self.thresholds.citation_growth_moderate:
-            score += 0.2
-
-        # Papers in last year significantly less than peak
-        if m.papers_last_year < m.peak_count * 0.7:
-            score += 0.15
+        Determine Hype Cycle phases for several metrics snapshots at once
 
-        return min(score, 1.0)
+        All rule predicates are stacked into a (snapshots x rules) matrix and
+        scored against every phase with a single matrix product.
 
-    def _score_slope(self, m: MetricsSnapshot) -> float:
-        """
-        Score for Slope of Enlightenment
+        Args:
+            metrics_list: Calculated metrics snapshots
 
-        Indicators:
-        - Gradual increase in publications after trough
-        - High applied research (60-80%)
-        - Steady citation growth
-        - Focus on implementations
+        Returns:
+            List of (phase, confidence, rule_scores, rationale) tuples, one per snapshot
         """
-        score = 0.0
-
-        # Moderate applied research percentage
-        if self.thresholds.applied_research_high <= m.applied_research_percentage < self.thresholds.applied_research_very_high:
-            score += 0.3
-
-        # Stable or gradually increasing velocity
-        if m.velocity_trend in ["stable", "increasing"] and m.growth_rate_early_vs_late > 0:
-            score += 0.25
-
-        # Moderate citation growth
-        if self.thresholds.citation_growth_moderate <= m.citation_growth_rate < self.thresholds.citation_growth_high:
-            score += 0.25
+        logger.info("Determining Hype Cycle phase from metrics...")
 
-        # Peak was a while ago (4-7 years)
-        if m.publication_velocity:
-            current_year = max(m.publication_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if 4 <= years_since_peak <= 7:
-                score += 0.2
+        # Fill a preallocated (snapshots x rules) buffer row by row
+        features = np.empty((len(metrics_list), N_RULES), dtype=np.float64)
+        for row, m in enumerate(metrics_list):
+            features[row] = self._rule_features(m)
 
-        return min(score, 1.0)
+        # Every phase is always scored: rule_scores reports all five, so there is no early exit.
+        # Each phase adds its weights rule by rule in column order (cumsum is strictly sequential),
+        # giving exactly the floats of adding each matched rule's weight in turn, so ties and the
+        # order of equal scores in the rationale are those of the original per-rule scoring
+        all_scores = np.minimum(np.cumsum(features[:, None, :] * RULE_WEIGHTS, axis=2)[:, :, -1], 1.0)
+        best_indices = np.argmax(all_scores, axis=1)
 
-    def _score_plateau(self, m: MetricsSnapshot) -> float:
-        """
-        Score for Plateau of Productivity
+        results = []
+        for metrics, scores, best_index in zip(metrics_list, all_scores.tolist(), best_indices.tolist()):
+            phase_scores = dict(zip(PHASE_ORDER, scores))
 
-        Indicators:
-        - Stable publication velocity (plateau)
-        - Very high applied research (>80%)
-        - High citations on established papers
-        - Industry focus
-        """
-        score = 0.0
+            # Highest scoring phase (first in phase order on ties)
+            best_phase = PHASE_ORDER[best_index]
+            confidence = scores[best_index]
 
-        # Very high applied research
-        if m.applied_research_percentage > self.thresholds.applied_research_very_high:
-            score += 0.35
+            logger.info(f"Phase determined: {best_phase.value} (confidence: {confidence:.2f})")
 
-        # Stable velocity
-        if m.velocity_trend == "stable":
-            score += 0.25
+            # Generate rationale
+            rationale = self._generate_rationale(best_phase, metrics, phase_scores)
 
-        # High average citations
-        if m.avg_citations_per_paper > 50:
-            score += 0.2
+            # Convert enum keys to strings for JSON serialization
+            phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
 
-        # Industry venues
-        if m.industry_venue_percentage > 30:
-            score += 0.1
+            results.append((best_phase, confidence, phase_scores_str, rationale))
 
-        # Peak was long ago (8+ years)
-        if m.publication_velocity:
-            current_year = max(m.publication_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if years_since_peak >= 8:
-                score += 0.1
-
-        return min(score, 1.0)
+        return results
 
     def _generate_rationale(self, phase: HypeCyclePhase, metrics: MetricsSnapshot,
                            scores: Dict[HypeCyclePhase, float]) -> str:
         """Generate human-readable explanation for phase determination"""
 
-        phase_info = PhaseCharacteristics.PHASE_DEFINITIONS[phase]
-
         rationale_parts = [
-            f"Phase determined: {phase_info['name']}",
+            f"Phase determined: {_PHASE_NAME[phase]}",
             f"Confidence score: {scores[phase]:.2f}",
             "",
             "Key indicators:",
@@ -304,9 +253,7 @@ class HypeCycleRuleEngine:
         # Add comparison with other phases
         rationale_parts.append("")
         rationale_parts.append("Phase scores (for comparison):")
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        for p, s in sorted_scores:
-            phase_name = PhaseCharacteristics.PHASE_DEFINITIONS[p]["name"]
-            rationale_parts.append(f"  {phase_name}: {s:.2f}")
+        sorted_scores = heapq.nlargest(len(scores), scores.items(), key=lambda x: x[1])
+        rationale_parts.extend(f"  {_PHASE_NAME[p]}: {s:.2f}" for p, s in sorted_scores)
 
         return "\n".join(rationale_parts)
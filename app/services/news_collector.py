@@ -1,16 +1,64 @@
 import httpx
+import asyncio
 import logging
 import hashlib
+import json
+import math
+import orjson
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..config import settings
 from ..models import Technology, NewsArticle
 
 logger = logging.getLogger(__name__)
 
+# HTTP client shared across collection runs so connections are reused (see get_newsapi_client)
+_newsapi_client: Optional[httpx.AsyncClient] = None
+
+
+def get_newsapi_client() -> httpx.AsyncClient:
+    """Get the shared NewsAPI HTTP client, creating it on first use"""
+    global _newsapi_client
+    if _newsapi_client is None or _newsapi_client.is_closed:
+        _newsapi_client = httpx.AsyncClient(
+            timeout=settings.request_timeout_seconds,
+            limits=httpx.Limits(max_keepalive_connections=settings.newsapi_max_concurrent_requests)
+        )
+    return _newsapi_client
+
+
+async def close_newsapi_client():
+    """Close the shared NewsAPI HTTP client (called on application shutdown)"""
+    global _newsapi_client
+    if _newsapi_client is not None:
+        await _newsapi_client.aclose()
+        _newsapi_client = None
+
+
+@lru_cache(maxsize=256)
+def _build_query_cached(keywords: Tuple[str, ...], excluded_terms: Tuple[str, ...]) -> str:
+    """Build the NewsAPI query string, memoized on the keyword/excluded-term lists"""
+    # Quote each keyword and join with OR operator
+    keyword_parts = [f'"{kw}"' for kw in keywords]
+    query = f"({' OR '.join(keyword_parts)})"
+
+    # Add excluded terms with NOT operator
+    if excluded_terms:
+        excluded_parts = [f'"{term}"' for term in excluded_terms]
+        query = f"{query} AND NOT ({' OR '.join(excluded_parts)})"
+
+    # Ensure query doesn't exceed 500 chars (NewsAPI limit)
+    if len(query) > 500:
+        logger.warning(f"Query length ({len(query)}) exceeds 500 chars, truncating...")
+        query = query[:497] + "..."
+
+    return query
+
 
 class NewsCollector:
     """Service for collecting news articles from NewsAPI.org"""
@@ -24,6 +72,7 @@ class NewsCollector:
         self.language = settings.newsapi_language
         self.sort_by = settings.newsapi_sort_by
         self.timeout = settings.request_timeout_seconds
+        self.max_concurrent_requests = settings.newsapi_max_concurrent_requests
 
     def build_query(self, technology: Technology) -> str:
         """
@@ -44,21 +93,10 @@ class NewsCollector:
         Returns:
             Formatted query string (max 500 chars)
         """
-        # Quote each keyword and join with OR operator
-        keyword_parts = [f'"{kw}"' for kw in technology.keywords]
-        query = f"({' OR '.join(keyword_parts)})"
-
-        # Add excluded terms with NOT operator
-        if technology.excluded_terms:
-            excluded_parts = [f'"{term}"' for term in technology.excluded_terms]
-            query = f"{query} AND NOT ({' OR '.join(excluded_parts)})"
-
-        # Ensure query doesn't exceed 500 chars (NewsAPI limit)
-        if len(query) > 500:
-            logger.warning(f"Query length ({len(query)}) exceeds 500 chars, truncating...")
-            query = query[:497] + "..."
-
-        return query
+        return _build_query_cached(
+            tuple(technology.keywords),
+            tuple(technology.excluded_terms or ())
+        )
 
     def get_date_range(self) -> Tuple[str, str]:
         """
@@ -77,20 +115,21 @@ class NewsCollector:
         # Using simplified format for clarity
         return (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
 
-    def _generate_article_id(self, article: Dict) -> str:
+    def _generate_article_id(self, article: Dict) -> bytes:
         """
         Generate unique article ID from URL
 
-        NewsAPI doesn't provide unique IDs, so we create one using MD5 hash of URL
+        NewsAPI doesn't provide unique IDs, so we create one using a BLAKE2b-128
+        hash of the URL (only uniqueness is needed, not cryptographic strength)
 
         Args:
             article: Article dictionary from API
 
         Returns:
-            MD5 hash of the article URL
+            Raw 16-byte BLAKE2b digest of the article URL
         """
         url = article.get("url", "")
-        return hashlib.md5(url.encode()).hexdigest()
+        return hashlib.blake2b(url.encode(), digest_size=16).digest()
 
     async def collect_articles(self, technology_id: int) -> Dict:
         """
@@ -134,14 +173,33 @@ class NewsCollector:
         }
 
         # Pagination (NewsAPI uses page numbers, starting at 1)
-        page = 1
-        total_collected = 0
+        client = get_newsapi_client()
+
+        # First page gives totalResults, which bounds the remaining pages
+        first_result = await self._fetch_batch(
+            client=client,
+            query=query,
+            from_date=from_date,
+            to_date=to_date,
+            page=1
+        )
+
+        if first_result is not None:
+            total = first_result[0]
+            stats["total_articles_found"] = total
+            logger.info(f"Total articles found: {total}")
+
+            pages_needed = min(
+                math.ceil(total / self.page_size),
+                math.ceil(self.max_articles / self.page_size)
+            )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while total_collected < self.max_articles:
-                try:
-                    # Fetch batch
-                    result = await self._fetch_batch(
+            # Fetch remaining pages concurrently, bounded to respect the rate limit
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+            async def fetch_page(page: int):
+                async with semaphore:
+                    return await self._fetch_batch(
                         client=client,
                         query=query,
                         from_date=from_date,
@@ -149,48 +207,58 @@ class NewsCollector:
                         page=page
                     )
 
-                    if result is None:
-                        break  # API error, stop collection
-
-                    total, articles = result
+            other_results = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, pages_needed + 1)),
+                return_exceptions=True
+            )
+            page_results = [first_result, *other_results]
+        else:
+            page_results = [first_result]
 
-                    # First batch - record total
-                    if page == 1:
-                        stats["total_articles_found"] = total
-                        logger.info(f"Total articles found: {total}")
+        # Process pages in order, stopping where sequential pagination would have stopped
+        loop = asyncio.get_running_loop()
+        for page, result in enumerate(page_results, start=1):
+            try:
+                if isinstance(result, Exception):
+                    raise result
 
-                    # No more articles
-                    if not articles:
-                        logger.info("No more articles available")
-                        break
+                if result is None:
+                    break  # API error, stop collection
 
-                    # Save articles to database
-                    new_count, duplicate_count = self._save_articles(
-                        articles=articles,
-                        technology_id=technology_id
-                    )
+                _, articles = result
 
-                    stats["new_articles"] += new_count
-                    stats["duplicate_articles"] += duplicate_count
-                    stats["articles_collected"] += len(articles)
-                    stats["batches_processed"] += 1
-                    total_collected += len(articles)
+                # No more articles
+                if not articles:
+                    logger.info("No more articles available")
+                    break
 
-                    logger.info(f"Page {page}: {len(articles)} articles, {new_count} new, {duplicate_count} duplicates")
+                # Save articles in thread pool to avoid blocking event loop
+                # (the session is only used by one thread at a time: the call is awaited)
+                new_count, duplicate_count = await loop.run_in_executor(
+                    None,
+                    self._save_articles,
+                    articles,
+                    technology_id
+                )
 
-                    # Check if we've reached the limit or no more pages
-                    if len(articles) < self.page_size:
-                        logger.info("Reached last page (fewer articles than page size)")
-                        break
+                stats["new_articles"] += new_count
+                stats["duplicate_articles"] += duplicate_count
+                stats["articles_collected"] += len(articles)
+                stats["batches_processed"] += 1
 
-                    page += 1
+                logger.info(f"Page {page}: {len(articles)} articles, {new_count} new, {duplicate_count} duplicates")
 
-                except Exception as e:
-                    error_msg = f"Error on page {page}: {str(e)}"
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
+                # Check if there are no more pages
+                if len(articles) < self.page_size:
+                    logger.info("Reached last page (fewer articles than page size)")
                     break
 
+            except Exception as e:
+                error_msg = f"Error on page {page}: {str(e)}"
+                logger.error(error_msg)
+                stats["errors"].append(error_msg)
+                break
+
         logger.info(f"Collection completed: {stats['new_articles']} new articles, {stats['duplicate_articles']} duplicates")
         return stats
 
@@ -235,7 +303,7 @@ class NewsCollector:
             response = await client.get(url, params=params, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # NewsAPI response: {"status": "ok", "totalResults": X, "articles": [...]}
             # or {"status": "error", "code": "...", "message": "..."}
@@ -278,41 +346,68 @@ class NewsCollector:
         Returns:
             Tuple of (new_count, duplicate_count)
         """
-        new_count = 0
-        duplicate_count = 0
-
+        rows = []
+        seen_ids = set()
         for article_data in articles:
-            try:
-                # Generate unique ID from URL
-                article_id = self._generate_article_id(article_data)
-
-                article = NewsArticle(
-                    technology_id=technology_id,
-                    article_id=article_id,
-                    title=article_data.get("title", ""),
-                    description=article_data.get("description"),
-                    content=article_data.get("content"),
-                    url=article_data.get("url", ""),
-                    url_to_image=article_data.get("urlToImage"),
-                    published_at=article_data.get("publishedAt"),
-                    author=article_data.get("author")
-                )
+            # Generate unique ID from URL, skipping repeats within the batch (e.g. wire reprints)
+            article_id = self._generate_article_id(article_data)
+            if article_id in seen_ids:
+                continue
+            seen_ids.add(article_id)
+
+            source = article_data.get("source")
+            rows.append({
+                "technology_id": technology_id,
+                "article_id": article_id,
+                "title": article_data.get("title") or "",
+                "description": article_data.get("description"),
+                "content": article_data.get("content"),
+                "url": article_data.get("url") or "",
+                "url_to_image": article_data.get("urlToImage"),
+                "published_at": article_data.get("publishedAt"),
+                "author": article_data.get("author"),
+                # Source object stored as JSON, as the NewsArticle.source property does
+                "_source": json.dumps(source) if source else None
+            })
+
+        if not rows:
+            return 0, 0
+
+        failed_count = 0
+        try:
+            new_count = self._insert_articles(rows)
+        except Exception as e:
+            # One bad row fails the whole statement: retry row by row so only that row is lost
+            self.db.rollback()
+            logger.warning(f"Bulk insert of {len(rows)} articles failed, retrying one by one: {str(e)}")
+            new_count = 0
+            for row in rows:
+                try:
+                    new_count += self._insert_articles([row])
+                except Exception as e:
+                    self.db.rollback()
+                    failed_count += 1
+                    logger.error(f"Error saving article {row['url']}: {str(e)}")
 
-                # Handle source object using property
-                article.source = article_data.get("source", {})
+        # Intra-batch repeats plus rows already stored
+        duplicate_count = len(articles) - new_count - failed_count
 
-                self.db.add(article)
-                self.db.commit()
-                new_count += 1
+        return new_count, duplicate_count
 
-            except IntegrityError:
-                # Duplicate article (violates unique constraint)
-                self.db.rollback()
-                duplicate_count += 1
-                logger.debug(f"Duplicate article skipped: {article_data.get('url')}")
+    def _insert_articles(self, rows: List[Dict]) -> int:
+        """
+        Insert article rows in one statement and commit
 
-            except Exception as e:
-                self.db.rollback()
-                logger.error(f"Error saving article {article_data.get('url')}: {str(e)}")
+        Duplicates (unique technology_id + article_id) are skipped by the database.
 
-        return new_count, duplicate_count
+        Returns:
+            Number of rows inserted
+        """
+        insert = pg_insert if self.db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(NewsArticle).values(rows).on_conflict_do_nothing(
+            index_elements=["technology_id", "article_id"]
+        )
+
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
@@ -1,5 +1,7 @@
-from typing import Dict, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+from dataclasses import dataclass, asdict, astuple
+from functools import lru_cache
+import numpy as np
 import logging
 
 from ..models.hype_cycle_phase import HypeCyclePhase, PhaseCharacteristics
@@ -8,9 +10,14 @@ from .news_metrics_calculator import NewsMetricsSnapshot
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewsRuleThresholds:
-    """Configurable thresholds for News-based rule evaluation"""
+    """
+    Configurable thresholds for News-based rule evaluation
+
+    Immutable: engines inline the values into their compiled rule predicates and score
+    cache key, so a different threshold set needs a new NewsRuleThresholds and engine.
+    """
 
     # Volume thresholds
     low_article_count: int = 30
@@ -29,216 +36,167 @@ class NewsRuleThresholds:
     low_hhi: float = 0.10
 
 
-class NewsHypeCycleRuleEngine:
-    """Rule-based engine for determining Hype Cycle phase from News data"""
-
-    def __init__(self, thresholds: NewsRuleThresholds = None):
-        self.thresholds = thresholds or NewsRuleThresholds()
-
-    def determine_phase(self, metrics: NewsMetricsSnapshot) -> Tuple[HypeCyclePhase, float, Dict, str]:
-        """
-        Determine Hype Cycle phase from News metrics
-
-        Args:
-            metrics: Calculated News metrics snapshot
-
-        Returns:
-            Tuple of (phase, confidence, rule_scores, rationale)
-        """
-        logger.info("Determining Hype Cycle phase from News metrics...")
-
-        phase_scores = {
-            HypeCyclePhase.TECHNOLOGY_TRIGGER: self._score_technology_trigger(metrics),
-            HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS: self._score_peak_inflated(metrics),
-            HypeCyclePhase.TROUGH_DISILLUSIONMENT: self._score_trough(metrics),
-            HypeCyclePhase.SLOPE_ENLIGHTENMENT: self._score_slope(metrics),
-            HypeCyclePhase.PLATEAU_PRODUCTIVITY: self._score_plateau(metrics)
-        }
-
-        best_phase = max(phase_scores, key=phase_scores.get)
-        confidence = phase_scores[best_phase]
-
-        logger.info(f"News phase determined: {best_phase.value} (confidence: {confidence:.2f})")
-
-        rationale = self._generate_rationale(best_phase, metrics, phase_scores)
-        phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
-
-        return best_phase, confidence, phase_scores_str, rationale
-
-    def _score_technology_trigger(self, m: NewsMetricsSnapshot) -> float:
-        """
-        Score for Technology Trigger phase
-
-        News Indicators:
-        - Few articles (limited media attention)
-        - Coverage from specialized/tech sources only
-        - Few sources covering the topic
-        - Limited author diversity
-        """
-        score = 0.0
-
-        # Few articles
-        if m.total_articles < self.thresholds.low_article_count:
-            score += 0.30
-
-        # Few sources (niche coverage)
-        if m.unique_sources < self.thresholds.low_source_count:
-            score += 0.25
-
-        # High source concentration (specialized media)
-        if m.source_concentration_hhi > self.thresholds.high_hhi:
-            score += 0.20
-
-        # Few authors covering
-        if m.unique_authors < 20:
-            score += 0.15
-
-        # Many articles without author (press releases, wire services)
-        if m.articles_without_author_percentage > 40:
-            score += 0.10
-
-        return min(score, 1.0)
-
-    def _score_peak_inflated(self, m: NewsMetricsSnapshot) -> float:
-        """
-        Score for Peak of Inflated Expectations
-
-        News Indicators:
-        - High/increasing publication velocity (media frenzy)
-        - Coverage from many diverse sources
-        - Low source concentration (everyone covering)
-        - Recent or current peak
-        - Many emerging keywords (hype words)
-        """
-        score = 0.0
-
-        # High or increasing velocity
-        if m.velocity_trend in ["increasing", "peak_reached"]:
-            score += 0.30
-
-        # Many sources covering
-        if m.unique_sources > self.thresholds.low_source_count:
-            score += 0.20
-
-        # Low concentration (broad coverage)
-        if m.source_concentration_hhi < self.thresholds.low_hhi:
-            score += 0.20
-
-        # High recent activity
-        if m.recent_velocity > m.avg_articles_per_month * 1.2:
-            score += 0.15
-
-        # Many emerging keywords (new hype terms)
-        if len(m.emerging_keywords) > 5:
-            score += 0.15
-
-        return min(score, 1.0)
-
-    def _score_trough(self, m: NewsMetricsSnapshot) -> float:
-        """
-        Score for Trough of Disillusionment
-
-        News Indicators:
-        - Declining article velocity
-        - Sources dropping coverage
-        - Declining keywords appear
-        - Negative growth rate
-        """
-        score = 0.0
-
-        # Declining velocity
-        if m.velocity_trend == "decreasing":
-            score += 0.35
-
-        # Negative growth rate
-        if m.growth_rate_early_vs_late < self.thresholds.decline_threshold:
-            score += 0.25
-
-        # Recent articles much fewer than earlier
-        if m.articles_last_3_months < m.articles_first_3_months * 0.5:
-            score += 0.20
-
-        # More declining than emerging keywords
-        if len(m.declining_keywords) > len(m.emerging_keywords):
-            score += 0.10
-
-        # Increasing source concentration (fewer sources remaining)
-        if m.source_concentration_hhi > self.thresholds.low_hhi:
-            score += 0.10
-
-        return min(score, 1.0)
-
-    def _score_slope(self, m: NewsMetricsSnapshot) -> float:
-        """
-        Score for Slope of Enlightenment
-
-        News Indicators:
-        - Stable publication velocity
-        - Moderate source diversity
-        - Balance of emerging and practical keywords
-        - Coverage focused on use cases
-        """
-        score = 0.0
-
-        # Stable velocity
-        if m.velocity_trend == "stable":
-            score += 0.30
-
-        # Moderate source coverage
-        if self.thresholds.low_source_count <= m.unique_sources <= self.thresholds.high_source_count:
-            score += 0.25
+# Phase order shared by the rows of the rule weight matrix
+PHASE_ORDER = (
+    HypeCyclePhase.TECHNOLOGY_TRIGGER,
+    HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS,
+    HypeCyclePhase.TROUGH_DISILLUSIONMENT,
+    HypeCyclePhase.SLOPE_ENLIGHTENMENT,
+    HypeCyclePhase.PLATEAU_PRODUCTIVITY,
+)
+
+# Weight of each rule (columns, in NewsHypeCycleRuleEngine._rule_features order) per phase (rows)
+RULE_WEIGHTS = np.array([
+    # Technology Trigger: few articles, few sources, concentrated sources, few authors, no-author articles
+    [0.30, 0.25, 0.20, 0.15, 0.10] + [0.0] * 20,
+    # Peak of Inflated Expectations: rising velocity, many sources, diverse sources, recent activity, hype terms
+    [0.0] * 5 + [0.30, 0.20, 0.20, 0.15, 0.15] + [0.0] * 15,
+    # Trough of Disillusionment: declining velocity, negative growth, recent drop, declining terms, concentration
+    [0.0] * 10 + [0.35, 0.25, 0.20, 0.10, 0.10] + [0.0] * 10,
+    # Slope of Enlightenment: stable velocity, moderate sources, moderate HHI, balanced keywords, data quality
+    [0.0] * 15 + [0.30, 0.25, 0.20, 0.15, 0.10] + [0.0] * 5,
+    # Plateau of Productivity: many articles, stable velocity, mainstream sources, diverse sources, content quality
+    [0.0] * 20 + [0.25, 0.25, 0.20, 0.15, 0.15],
+])
+
+
+@dataclass(frozen=True)
+class NewsScoringInputs:
+    """Scalar NewsMetricsSnapshot values the rules read; hashable, used as the score cache key"""
+
+    total_articles: int
+    velocity_trend: str
+    avg_articles_per_month: float
+    recent_velocity: float
+    unique_sources: int
+    source_concentration_hhi: float
+    unique_authors: int
+    articles_without_author_percentage: float
+    emerging_keyword_count: int
+    declining_keyword_count: int
+    articles_last_3_months: int
+    articles_first_3_months: int
+    growth_rate_early_vs_late: float
+    coverage_percentage: float
+
+    @classmethod
+    def from_metrics(cls, m: NewsMetricsSnapshot) -> "NewsScoringInputs":
+        """Extract the scoring inputs from a metrics snapshot (keyword lists reduce to their lengths)"""
+        return cls(
+            total_articles=m.total_articles,
+            velocity_trend=m.velocity_trend,
+            avg_articles_per_month=m.avg_articles_per_month,
+            recent_velocity=m.recent_velocity,
+            unique_sources=m.unique_sources,
+            source_concentration_hhi=m.source_concentration_hhi,
+            unique_authors=m.unique_authors,
+            articles_without_author_percentage=m.articles_without_author_percentage,
+            emerging_keyword_count=len(m.emerging_keywords),
+            declining_keyword_count=len(m.declining_keywords),
+            articles_last_3_months=m.articles_last_3_months,
+            articles_first_3_months=m.articles_first_3_months,
+            growth_rate_early_vs_late=m.growth_rate_early_vs_late,
+            coverage_percentage=m.coverage_percentage
+        )
+
+
+# Rule predicates in RULE_WEIGHTS column order; {threshold} fields are inlined per NewsRuleThresholds
+_RULE_FEATURES_SOURCE = """
+def rule_features(m):
+    return [
+        # Technology Trigger
+        m.total_articles < {low_article_count!r},  # limited media attention
+        m.unique_sources < {low_source_count!r},  # niche coverage
+        m.source_concentration_hhi > {high_hhi!r},  # specialized media
+        m.unique_authors < 20,  # few authors covering
+        m.articles_without_author_percentage > 40,  # press releases, wire services
+
+        # Peak of Inflated Expectations
+        m.velocity_trend in ("increasing", "peak_reached"),  # media frenzy
+        m.unique_sources > {low_source_count!r},  # many sources covering
+        m.source_concentration_hhi < {low_hhi!r},  # broad coverage
+        m.recent_velocity > m.avg_articles_per_month * 1.2,  # high recent activity
+        m.emerging_keyword_count > 5,  # new hype terms
+
+        # Trough of Disillusionment
+        m.velocity_trend == "decreasing",
+        m.growth_rate_early_vs_late < {decline_threshold!r},  # negative growth rate
+        m.articles_last_3_months < m.articles_first_3_months * 0.5,  # recent articles much fewer
+        m.declining_keyword_count > m.emerging_keyword_count,
+        m.source_concentration_hhi > {low_hhi!r},  # fewer sources remaining
+
+        # Slope of Enlightenment
+        m.velocity_trend == "stable",
+        {low_source_count!r} <= m.unique_sources <= {high_source_count!r},  # moderate coverage
+        {low_hhi!r} <= m.source_concentration_hhi <= {high_hhi!r},  # established coverage pattern
+        m.emerging_keyword_count > 0 and m.declining_keyword_count > 0,  # balance of keywords
+        m.coverage_percentage > 60,  # good data quality
+
+        # Plateau of Productivity
+        m.total_articles > {high_article_count!r},  # mature topic
+        m.velocity_trend == "stable",
+        m.unique_sources > {high_source_count!r},  # mainstream coverage
+        m.source_concentration_hhi < {low_hhi!r},
+        m.coverage_percentage > 70,  # good content quality
+    ]
+"""
+
+
+@lru_cache(maxsize=32)
+def _compile_rule_features(threshold_values: Tuple) -> Callable[[NewsScoringInputs], List[bool]]:
+    """
+    Compile the News rule predicates specialized for one threshold set
+
+    Args:
+        threshold_values: NewsRuleThresholds field values (astuple), used as cache key
+
+    Returns:
+        Function mapping NewsScoringInputs to their rule outcomes
+    """
+    source = _RULE_FEATURES_SOURCE.format(**asdict(NewsRuleThresholds(*threshold_values)))
+    namespace = {}
+    exec(compile(source, "<news_rule_features>", "exec"), namespace)
+    return namespace["rule_features"]
+
+
+@lru_cache(maxsize=1024)
+def _score_phases(rule_features: Callable[[NewsScoringInputs], List[bool]], inputs: NewsScoringInputs) -> Tuple[float, ...]:
+    """
+    Score every phase for one set of scoring inputs, memoized
+
+    The compiled predicates (one function per threshold set, see _compile_rule_features)
+    are part of the key, so different thresholds never return each other's scores.
+
+    Args:
+        rule_features: Rule predicates compiled for the engine's thresholds
+        inputs: Scoring inputs extracted from a News metrics snapshot
+
+    Returns:
+        Phase scores in PHASE_ORDER
+    """
+    features = np.array(rule_features(inputs), dtype=np.float64)
+
+    # Each phase adds its weights rule by rule in column order (cumsum is strictly sequential),
+    # giving exactly the floats of adding each matched rule's weight in turn, so ties and the
+    # order of equal scores in the rationale are those of the original per-rule scoring
+    return tuple(np.minimum(np.cumsum(RULE_WEIGHTS * features, axis=1)[:, -1], 1.0).tolist())
 
-        # Moderate HHI (established coverage pattern)
-        if self.thresholds.low_hhi <= m.source_concentration_hhi <= self.thresholds.high_hhi:
-            score += 0.20
 
-        # Balance of keywords
-        if len(m.emerging_keywords) > 0 and len(m.declining_keywords) > 0:
-            score += 0.15
-
-        # Good data quality
-        if m.coverage_percentage > 60:
-            score += 0.10
-
-        return min(score, 1.0)
-
-    def _score_plateau(self, m: NewsMetricsSnapshot) -> float:
-        """
-        Score for Plateau of Productivity
-
-        News Indicators:
-        - High total article count (established topic)
-        - Stable velocity
-        - Wide source coverage (mainstream)
-        - Consistent coverage patterns
-        """
-        score = 0.0
-
-        # High article count (mature topic)
-        if m.total_articles > self.thresholds.high_article_count:
-            score += 0.25
-
-        # Stable velocity
-        if m.velocity_trend == "stable":
-            score += 0.25
-
-        # Wide source coverage
-        if m.unique_sources > self.thresholds.high_source_count:
-            score += 0.20
-
-        # Low HHI (mainstream coverage)
-        if m.source_concentration_hhi < self.thresholds.low_hhi:
-            score += 0.15
+@dataclass
+class NewsRationale:
+    """
+    Human-readable explanation for a News-based phase determination
 
-        # Good content quality
-        if m.coverage_percentage > 70:
-            score += 0.15
+    The text is only built when the rationale is converted with str(), so callers
+    that need just the phase and scores pay nothing for it.
+    """
 
-        return min(score, 1.0)
+    phase: HypeCyclePhase
+    metrics: NewsMetricsSnapshot
+    scores: Dict[HypeCyclePhase, float]
 
-    def _generate_rationale(self, phase: HypeCyclePhase, metrics: NewsMetricsSnapshot,
-                           scores: Dict[HypeCyclePhase, float]) -> str:
-        """Generate human-readable explanation for News-based phase determination"""
+    def __str__(self) -> str:
+        phase, metrics, scores = self.phase, self.metrics, self.scores
 
         phase_info = PhaseCharacteristics.PHASE_DEFINITIONS[phase]
 
@@ -304,3 +262,42 @@ class NewsHypeCycleRuleEngine:
             rationale_parts.append(f"  {phase_name}: {s:.2f}")
 
         return "\n".join(rationale_parts)
+
+
+class NewsHypeCycleRuleEngine:
+    """Rule-based engine for determining Hype Cycle phase from News data"""
+
+    def __init__(self, thresholds: NewsRuleThresholds = None):
+        self.thresholds = thresholds or NewsRuleThresholds()
+        # Rule predicates compiled once with this engine's thresholds inlined as constants;
+        # also the score cache key
+        self._rule_features = _compile_rule_features(astuple(self.thresholds))
+
+    def determine_phase(self, metrics: NewsMetricsSnapshot) -> Tuple[HypeCyclePhase, float, Dict, NewsRationale]:
+        """
+        Determine Hype Cycle phase from News metrics
+
+        Args:
+            metrics: Calculated News metrics snapshot
+
+        Returns:
+            Tuple of (phase, confidence, rule_scores, rationale); str(rationale) gives the text
+        """
+        logger.info("Determining Hype Cycle phase from News metrics...")
+
+        # All five phase scores from one product of the rule outcomes with the weight matrix,
+        # cached per (thresholds, scoring inputs) for repeated evaluations of the same technology
+        scores = _score_phases(self._rule_features, NewsScoringInputs.from_metrics(metrics))
+        phase_scores = dict(zip(PHASE_ORDER, scores))
+
+        # Highest scoring phase (first in phase order on ties)
+        best_index = scores.index(max(scores))
+        best_phase = PHASE_ORDER[best_index]
+        confidence = scores[best_index]
+
+        logger.info(f"News phase determined: {best_phase.value} (confidence: {confidence:.2f})")
+
+        rationale = NewsRationale(best_phase, metrics, phase_scores)
+        phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
+
+        return best_phase, confidence, phase_scores_str, rationale
@@ -1,16 +1,58 @@
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
-from collections import defaultdict, Counter
+from sqlalchemy import func, case, cast, null, JSON, String
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import copy
+import time
 import re
 import logging
 
+from ..config import settings
+from ..database import SessionLocal, engine
 from ..models import NewsArticle
 
 logger = logging.getLogger(__name__)
 
+# Keyword tokenizer: lowercase words of 4+ letters
+_TOKEN_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# ASCII fast path for _TOKEN_RE: word characters other than a-z become "0" (so words containing
+# them fail isalpha(), as they fail the regex), every other character becomes a space
+_ASCII_TOKEN_TABLE = str.maketrans({
+    code: "0" if chr(code).isalnum() or chr(code) == "_" else " "
+    for code in range(128)
+    if not "a" <= chr(code) <= "z"
+})
+
+
+def _tokenize(text: str) -> List[str]:
+    """Extract keyword tokens (lowercase words of 4+ letters), in text order"""
+    if text.isascii():
+        # str.translate + split run as tight C loops, unlike the regex engine's per-character matching
+        return [word for word in text.translate(_ASCII_TOKEN_TABLE).split() if len(word) > 3 and word.isalpha()]
+    return _TOKEN_RE.findall(text)
+
+
+# Tokens buffered before each bulk Counter update (bounds buffer memory)
+_TOKEN_BUFFER_SIZE = 100_000
+
+_MICROSECONDS_PER_DAY = 86400 * 1_000_000
+
+# Common words excluded from keyword metrics
+_STOPWORDS = frozenset({
+    "this", "that", "with", "from", "were", "have", "been", "their",
+    "which", "these", "more", "other", "such", "into", "only", "also",
+    "than", "some", "time", "very", "when", "them", "they", "there",
+    "where", "what", "about", "after", "before", "would", "could",
+    "should", "being", "between", "through", "during", "using",
+    "said", "says", "will", "year", "years", "according", "news",
+    "report", "reported", "reports", "article", "read", "more"
+})
+
 
 @dataclass
 class NewsMetricsSnapshot:
@@ -56,59 +98,325 @@ class NewsMetricsSnapshot:
         return asdict(self)
 
 
+# Last snapshot per technology: technology_id -> (cache key, monotonic time computed, snapshot).
+# The key (article count, max article id, max published_at) changes whenever articles are
+# added or removed
+_snapshot_cache: Dict[int, Tuple[Tuple, float, NewsMetricsSnapshot]] = {}
+
+# Session owned by each batch worker process (see _init_metrics_worker)
+_worker_db: Optional[Session] = None
+
+
+def _init_metrics_worker():
+    """Open one database session per batch worker process"""
+    global _worker_db
+    # Pooled connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+    _worker_db = SessionLocal()
+
+
+def _calculate_metrics_worker(technology_id: int) -> Tuple[int, Optional[Dict], Optional[str]]:
+    """Calculate one technology's metrics in a worker process (the snapshot cache is per process, so it is bypassed)"""
+    try:
+        metrics = NewsMetricsCalculator(_worker_db).calculate_metrics(technology_id, use_cache=False)
+        return technology_id, metrics.to_dict(), None
+    except Exception as e:
+        _worker_db.rollback()
+        return technology_id, None, str(e)
+
+
 class NewsMetricsCalculator:
     """Calculate metrics from News data for Hype Cycle analysis"""
 
     def __init__(self, db: Session):
         self.db = db
 
-    def calculate_metrics(self, technology_id: int) -> NewsMetricsSnapshot:
+    def calculate_metrics(self, technology_id: int, use_cache: bool = True) -> NewsMetricsSnapshot:
         """
         Calculate all metrics for a technology's news articles
 
         Args:
             technology_id: ID of technology to analyze
+            use_cache: Reuse and store snapshots in this process's snapshot cache
 
         Returns:
             NewsMetricsSnapshot with all calculated metrics
         """
         logger.info(f"Starting News metrics calculation for technology {technology_id}")
 
-        # Fetch all articles for this technology
-        articles = self.db.query(NewsArticle)\
-            .filter(NewsArticle.technology_id == technology_id)\
-            .order_by(NewsArticle.published_at)\
-            .all()
+        # Counts that need no per-article Python work are aggregated in the database
+        aggregates = self._fetch_aggregates(technology_id)
+        total_articles = aggregates["total_articles"]
 
-        if not articles:
-            raise ValueError(f"No news articles found for technology {technology_id}")
+        # Reuse the last snapshot if the technology's articles have not changed since
+        cache_key = (total_articles, aggregates["max_article_id"], aggregates["max_published_at"])
+        if use_cache:
+            cached = self._get_cached_snapshot(technology_id, cache_key)
+            if cached is not None:
+                logger.info(f"Using cached News metrics for technology {technology_id}")
+                return cached
 
-        if len(articles) < 10:
-            raise ValueError(f"Insufficient articles for analysis. Found {len(articles)}, need at least 10.")
+        if not total_articles:
+            raise ValueError(f"No news articles found for technology {technology_id}")
 
-        logger.info(f"Found {len(articles)} news articles to analyze")
+        if total_articles < 10:
+            raise ValueError(f"Insufficient articles for analysis. Found {total_articles}, need at least 10.")
+
+        logger.info(f"Found {total_articles} news articles to analyze")
+
+        # Fetch only the columns the metrics need; text is lowercased and concatenated
+        # in the database (headline = title + description) so Python only tokenizes
+        headline = func.lower(func.coalesce(NewsArticle.title, "") + " " + func.coalesce(NewsArticle.description, ""))
+        content = func.lower(func.coalesce(NewsArticle.content, ""))
+        rows = self.db.query(
+            NewsArticle.published_at,
+            NewsArticle.author,
+            self._source_name_column(),
+            headline,
+            content
+        )\
+            .filter(NewsArticle.technology_id == technology_id)\
+            .order_by(NewsArticle.published_at)\
+            .yield_per(2000)
 
-        # Calculate each metric category
-        volume_metrics = self._calculate_volume_metrics(articles)
-        source_metrics = self._calculate_source_metrics(articles)
-        author_metrics = self._calculate_author_metrics(articles)
-        topic_metrics = self._calculate_topic_metrics(articles)
-        temporal_metrics = self._calculate_temporal_metrics(articles)
-        quality_metrics = self._calculate_quality_metrics(articles)
+        # Single streamed pass over the articles, then derive each metric category
+        totals = {**aggregates, **self._aggregate_articles(rows, total_articles)}
 
-        # Combine into snapshot
         metrics = NewsMetricsSnapshot(
-            **volume_metrics,
-            **source_metrics,
-            **author_metrics,
-            **topic_metrics,
-            **temporal_metrics,
-            **quality_metrics
+            **self._calculate_volume_metrics(totals),
+            **self._calculate_source_metrics(totals),
+            **self._calculate_author_metrics(totals),
+            **self._calculate_topic_metrics(totals),
+            **self._calculate_temporal_metrics(totals),
+            **self._calculate_quality_metrics(totals)
         )
 
+        if use_cache:
+            self._store_cached_snapshot(technology_id, cache_key, metrics)
+
         logger.info("News metrics calculation completed")
         return metrics
 
+    def calculate_metrics_batch(self, technology_ids: List[int], max_workers: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Calculate metrics for several technologies in parallel worker processes
+
+        Each technology is independent and CPU-bound (tokenization dominates), so they
+        are spread over a process pool; every worker opens its own database session.
+
+        Meant for offline batch runs (scripts), not request handlers: workers manage their
+        own sessions outside get_db, and they bypass the snapshot cache, which would only
+        live in the worker process.
+
+        Args:
+            technology_ids: IDs of technologies to analyze
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            Dict of technology_id -> metrics dict (NewsMetricsSnapshot.to_dict());
+            technologies whose calculation fails are logged and omitted
+        """
+        logger.info(f"Starting News metrics batch calculation for {len(technology_ids)} technologies")
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_metrics_worker) as executor:
+            for technology_id, metrics, error in executor.map(_calculate_metrics_worker, technology_ids):
+                if error is not None:
+                    logger.warning(f"News metrics calculation failed for technology {technology_id}: {error}")
+                    continue
+                results[technology_id] = metrics
+
+        logger.info(f"News metrics batch calculation completed: {len(results)}/{len(technology_ids)} technologies")
+        return results
+
+    def _fetch_aggregates(self, technology_id: int) -> Dict:
+        """
+        Count articles, content/description coverage and missing authors in one SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            Dict with total_articles, max_article_id, max_published_at (snapshot cache key),
+            with_content, with_description and without_author
+        """
+        has_content = func.coalesce(NewsArticle.content, "") != ""
+        has_description = func.coalesce(NewsArticle.description, "") != ""
+        no_author = func.trim(func.coalesce(NewsArticle.author, ""), " \t\r\n") == ""
+
+        total, max_article_id, max_published_at, with_content, with_description, without_author = self.db.query(
+            func.count(NewsArticle.id),
+            func.max(NewsArticle.id),
+            func.max(NewsArticle.published_at),
+            func.sum(case((has_content, 1), else_=0)),
+            func.sum(case((has_description, 1), else_=0)),
+            func.sum(case((no_author, 1), else_=0))
+        )\
+            .filter(NewsArticle.technology_id == technology_id)\
+            .one()
+
+        return {
+            "total_articles": total,
+            "max_article_id": max_article_id,
+            "max_published_at": max_published_at,
+            "with_content": with_content or 0,
+            "with_description": with_description or 0,
+            "without_author": without_author or 0
+        }
+
+    def _source_name_column(self):
+        """
+        SQL expression extracting the source name from the stored source JSON
+
+        Like source.get("name", "unknown"): articles without a source or without a
+        "name" key give "unknown", a null name gives None and an empty name "".
+        Non-string names are returned as their JSON text, so all names are strings or None.
+        """
+        source_json = func.nullif(NewsArticle._source, "")
+        if self.db.bind.dialect.name == "postgresql":
+            name_json = cast(source_json, JSON)["name"]
+            name_type = func.json_typeof(name_json)
+            name = name_json.as_string()
+        else:
+            name_type = func.json_type(source_json, "$.name")
+            name = cast(func.json_extract(source_json, "$.name"), String)
+
+        # The JSON type is NULL only when the key (or the whole source) is missing
+        return case(
+            (name_type.is_(None), "unknown"),
+            (name_type == "null", null()),
+            else_=name
+        )
+
+    def _get_cached_snapshot(self, technology_id: int, cache_key: Tuple) -> Optional[NewsMetricsSnapshot]:
+        """
+        Get a cached snapshot computed from the same articles within the TTL
+
+        The TTL bounds staleness of the date-window metrics (e.g. articles_last_month),
+        which change with the current date even when the articles do not.
+
+        Returns:
+            A copy of the cached snapshot, or None
+        """
+        entry = _snapshot_cache.get(technology_id)
+        if entry is None:
+            return None
+
+        key, computed_at, snapshot = entry
+        if key != cache_key or time.monotonic() - computed_at > settings.hype_cycle_news_metrics_cache_ttl_seconds:
+            return None
+
+        return copy.deepcopy(snapshot)
+
+    def _store_cached_snapshot(self, technology_id: int, cache_key: Tuple, snapshot: NewsMetricsSnapshot):
+        """Cache a freshly computed snapshot (a copy, so callers may modify theirs)"""
+        if settings.hype_cycle_news_metrics_cache_ttl_seconds > 0:
+            _snapshot_cache[technology_id] = (cache_key, time.monotonic(), copy.deepcopy(snapshot))
+
+    def _aggregate_articles(self, rows: Iterable[Tuple], total_articles: int) -> Dict:
+        """
+        Accumulate every per-article counter in a single pass
+
+        Args:
+            rows: (published_at, author, source_name, headline_text, content_text)
+                  tuples ordered by publication date, consumed as a stream
+            total_articles: Number of rows (from the SQL aggregate), used to split old/recent halves
+
+        Returns:
+            Dict of counters and accumulators consumed by the metric helpers
+        """
+        logger.info("Aggregating News articles...")
+
+        midpoint = total_articles // 2
+
+        published = []
+        source_names = []
+        authors = []
+        words = Counter()
+        old_words = Counter()
+        recent_words = Counter()
+
+        # Tokens are buffered and counted in bulk (one C-level Counter update per buffer
+        # instead of several Python update calls per article); order is preserved, so
+        # most_common tie order is unchanged
+        word_tokens = []
+        old_tokens = []
+        recent_tokens = []
+
+        for index, (published_at, author, source_name, headline_text, content_text) in enumerate(rows):
+            # Volume / temporal: dates are parsed in one vectorized call after the loop
+            published.append(published_at)
+
+            # Sources (name extracted from the source JSON in SQL)
+            source_names.append(source_name)
+
+            # Authors
+            if author and author.strip():
+                authors.append(author)
+
+            # Topics: headline tokens feed both the overall and the old/recent counts
+            headline_tokens = _tokenize(headline_text)
+            word_tokens += headline_tokens
+            word_tokens += _tokenize(content_text)
+            if index < midpoint:
+                old_tokens += headline_tokens
+            else:
+                recent_tokens += headline_tokens
+
+            if len(word_tokens) >= _TOKEN_BUFFER_SIZE:
+                self._flush_tokens(words, word_tokens)
+                self._flush_tokens(old_words, old_tokens)
+                self._flush_tokens(recent_words, recent_tokens)
+
+        self._flush_tokens(words, word_tokens)
+        self._flush_tokens(old_words, old_tokens)
+        self._flush_tokens(recent_words, recent_tokens)
+
+        dates = self._parse_dates(published)
+
+        # Group by year-month: bincount over integer month numbers (months since 1970),
+        # formatting "YYYY-MM" keys only for the non-empty buckets
+        month_counts = {}
+        if len(dates):
+            months = dates.astype("datetime64[M]").view(np.int64)
+            first_month = int(months.min())
+            counts = np.bincount(months - first_month)
+            for offset in np.flatnonzero(counts).tolist():
+                month_counts[str(np.datetime64(first_month + offset, "M"))] = int(counts[offset])
+
+        return {
+            "month_counts": month_counts,
+            "dates": dates,
+            "source_names": source_names,
+            "authors": authors,
+            "words": words,
+            "old_words": old_words,
+            "recent_words": recent_words
+        }
+
+    def _flush_tokens(self, counter: Counter, tokens: List[str]):
+        """Add a buffer of tokens to a counter, then empty the buffer"""
+        counter.update(tokens)
+        tokens.clear()
+
+    def _rank_values(self, values: List) -> Tuple[List, np.ndarray]:
+        """
+        Count distinct values and rank them by frequency
+
+        Counter hashes instead of sorting, so values need not be mutually comparable
+        (e.g. None next to strings); ties keep first-occurrence order.
+
+        Args:
+            values: Hashable values
+
+        Returns:
+            Tuple of (distinct values, counts), most frequent first
+        """
+        ranked = Counter(values).most_common()
+        names = [name for name, _ in ranked]
+        counts = np.array([count for _, count in ranked], dtype=np.int64)
+        return names, counts
+
     def _parse_date(self, date_str: str) -> datetime:
         """Parse ISO 8601 date string to datetime"""
         if not date_str:
@@ -127,17 +435,32 @@ class NewsMetricsCalculator:
         except (ValueError, TypeError):
             return None
 
-    def _calculate_volume_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _parse_dates(self, date_strs: List[str]) -> np.ndarray:
+        """
+        Parse ISO 8601 date strings into a datetime64[us] array in one vectorized call
+
+        Like _parse_date, "Z" / "+HH:MM" / "-HH:MM" timezone suffixes are dropped (wall-clock
+        time is kept; numpy would otherwise shift offset times to UTC), fractional seconds are
+        kept to the microsecond (datetime's resolution) and missing dates are skipped.
+        """
+        trimmed = []
+        for date_str in date_strs:
+            if date_str:
+                date, sep, time = date_str.partition("T")
+                trimmed.append(date + sep + time.partition("Z")[0].partition("+")[0].partition("-")[0])
+        try:
+            return np.array(trimmed, dtype="datetime64[us]")
+        except ValueError:
+            # Some value is malformed: fall back to per-date parsing, skipping failures
+            parsed = [self._parse_date(date_str) for date_str in date_strs]
+            return np.array([dt.replace(tzinfo=None) for dt in parsed if dt], dtype="datetime64[us]")
+
+    def _calculate_volume_metrics(self, totals: Dict) -> Dict:
         """Calculate article volume and velocity metrics"""
         logger.info("Calculating News volume metrics...")
 
-        # Group by year-month
-        month_counts = defaultdict(int)
-        for article in articles:
-            dt = self._parse_date(article.published_at)
-            if dt:
-                month_key = f"{dt.year}-{dt.month:02d}"
-                month_counts[month_key] += 1
+        month_counts = totals["month_counts"]
+        total_articles = totals["total_articles"]
 
         # Sort months
         sorted_months = sorted(month_counts.keys())
@@ -145,20 +468,22 @@ class NewsMetricsCalculator:
         if not sorted_months:
             raise ValueError("No articles with date information")
 
-        # Find peak
-        peak_month = max(month_counts, key=month_counts.get)
-        peak_count = month_counts[peak_month]
+        # Find peak (first month with the highest count) in one scan of the sorted counts
+        counts = np.array([month_counts[m] for m in sorted_months])
+        peak_index = int(counts.argmax())
+        peak_month = sorted_months[peak_index]
+        peak_count = int(counts[peak_index])
 
         # Calculate trend
         if len(sorted_months) >= 6:
-            recent_3m = sum(month_counts[m] for m in sorted_months[-3:]) / 3
-            earlier_3m = sum(month_counts[m] for m in sorted_months[:3]) / 3
+            recent_3m = int(counts[-3:].sum()) / 3
+            earlier_3m = int(counts[:3].sum()) / 3
 
             if recent_3m > earlier_3m * 1.2:
                 trend = "increasing"
             elif recent_3m < earlier_3m * 0.8:
                 trend = "decreasing"
-            elif peak_month in sorted_months[-3:]:
+            elif peak_index >= len(sorted_months) - 3:
                 trend = "peak_reached"
             else:
                 trend = "stable"
@@ -166,33 +491,30 @@ class NewsMetricsCalculator:
             trend = "insufficient_data"
 
         # Recent velocity (last 3 months)
-        recent_velocity = sum(month_counts[m] for m in sorted_months[-3:]) / min(3, len(sorted_months))
+        recent_velocity = int(counts[-3:].sum()) / min(3, len(sorted_months))
 
         return {
-            "total_articles": len(articles),
+            "total_articles": total_articles,
             "article_velocity": dict(month_counts),
             "velocity_trend": trend,
-            "avg_articles_per_month": len(articles) / max(len(sorted_months), 1),
+            "avg_articles_per_month": total_articles / max(len(sorted_months), 1),
             "peak_month": peak_month,
             "peak_count": peak_count,
             "recent_velocity": recent_velocity
         }
 
-    def _calculate_source_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _calculate_source_metrics(self, totals: Dict) -> Dict:
         """Calculate source distribution metrics"""
         logger.info("Calculating News source metrics...")
 
-        source_counts = Counter()
-        for article in articles:
-            source = article.source
-            source_name = source.get("name", "unknown") if source else "unknown"
-            source_counts[source_name] += 1
+        names, counts = self._rank_values(totals["source_names"])
 
-        unique_sources = len(source_counts)
-        top_sources = source_counts.most_common(10)
+        unique_sources = len(names)
+        top_sources = list(zip(names[:10], counts[:10].tolist()))
 
         # Calculate HHI
-        hhi = self._calculate_hhi(source_counts)
+        # Every article has exactly one source name, so the total is the article count
+        hhi = self._calculate_hhi(counts, len(totals["source_names"]))
 
         return {
             "unique_sources": unique_sources,
@@ -200,23 +522,15 @@ class NewsMetricsCalculator:
             "source_concentration_hhi": hhi
         }
 
-    def _calculate_author_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _calculate_author_metrics(self, totals: Dict) -> Dict:
         """Calculate author distribution metrics"""
         logger.info("Calculating News author metrics...")
 
-        author_counts = Counter()
-        without_author = 0
+        names, counts = self._rank_values(totals["authors"])
 
-        for article in articles:
-            author = article.author
-            if author and author.strip():
-                author_counts[author] += 1
-            else:
-                without_author += 1
-
-        unique_authors = len(author_counts)
-        top_authors = author_counts.most_common(10)
-        without_author_pct = (without_author / len(articles)) * 100
+        unique_authors = len(names)
+        top_authors = list(zip(names[:10], counts[:10].tolist()))
+        without_author_pct = (totals["without_author"] / totals["total_articles"]) * 100
 
         return {
             "unique_authors": unique_authors,
@@ -224,103 +538,72 @@ class NewsMetricsCalculator:
             "articles_without_author_percentage": without_author_pct
         }
 
-    def _calculate_hhi(self, counts: Dict[str, int]) -> float:
+    def _calculate_hhi(self, counts: np.ndarray, total: Optional[int] = None) -> float:
         """
         Calculate Herfindahl-Hirschman Index (HHI)
 
         HHI = sum of squared market shares
         Range: 0 (perfect competition) to 1 (monopoly)
+
+        Args:
+            counts: Count per market participant
+            total: Sum of counts, when the caller already knows it (saves a reduction)
         """
-        total = sum(counts.values())
+        counts = np.asarray(counts, dtype=np.float64)
+        if total is None:
+            total = counts.sum()
         if total == 0:
             return 0.0
 
-        hhi = sum((count / total) ** 2 for count in counts.values())
+        # Sum of squared counts over squared total: one division instead of one per entry
+        hhi = float((counts * counts).sum() / (total * total))
         return hhi
 
-    def _calculate_topic_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _calculate_topic_metrics(self, totals: Dict) -> Dict:
         """Extract and analyze keywords from titles/descriptions"""
         logger.info("Calculating News topic metrics...")
 
-        all_text = []
-        for article in articles:
-            if article.title:
-                all_text.append(article.title.lower())
-            if article.description:
-                all_text.append(article.description.lower())
-            if article.content:
-                all_text.append(article.content.lower())
-
-        # Extract keywords
-        words = Counter()
-        for text in all_text:
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            words.update(tokens)
-
-        # Filter stopwords
-        stopwords = {
-            "this", "that", "with", "from", "were", "have", "been", "their",
-            "which", "these", "more", "other", "such", "into", "only", "also",
-            "than", "some", "time", "very", "when", "them", "they", "there",
-            "where", "what", "about", "after", "before", "would", "could",
-            "should", "being", "between", "through", "during", "using",
-            "said", "says", "will", "year", "years", "according", "news",
-            "report", "reported", "reports", "article", "read", "more"
-        }
-        top_keywords = [(w, c) for w, c in words.most_common(50) if w not in stopwords]
+        words = totals["words"]
+        old_words = totals["old_words"]
+        recent_words = totals["recent_words"]
 
-        # Compare recent vs old articles for emerging/declining keywords
-        midpoint = len(articles) // 2
-        old_articles = articles[:midpoint]
-        recent_articles = articles[midpoint:]
-
-        old_words = Counter()
-        recent_words = Counter()
+        # Filter stopwords (most_common(n) selects with heapq.nlargest: O(V log n), no full sort)
+        top_keywords = [(w, c) for w, c in words.most_common(50) if w not in _STOPWORDS]
 
-        for article in old_articles:
-            text = (article.title or "").lower() + " " + (article.description or "").lower()
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            old_words.update(tokens)
-
-        for article in recent_articles:
-            text = (article.title or "").lower() + " " + (article.description or "").lower()
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            recent_words.update(tokens)
-
-        # Emerging keywords
-        emerging_keywords = []
-        for word, recent_count in recent_words.most_common(30):
-            if word not in stopwords:
-                old_count = old_words.get(word, 0)
-                if recent_count > old_count * 2 and recent_count >= 5:
-                    emerging_keywords.append(word)
-
-        # Declining keywords
-        declining_keywords = []
-        for word, old_count in old_words.most_common(30):
-            if word not in stopwords:
-                recent_count = recent_words.get(word, 0)
-                if old_count > recent_count * 2 and old_count >= 5:
-                    declining_keywords.append(word)
+        # Emerging (recent half) and declining (old half) keywords
+        emerging_keywords = self._shifted_keywords(recent_words, old_words)
+        declining_keywords = self._shifted_keywords(old_words, recent_words)
 
         return {
             "top_keywords": top_keywords[:20],
-            "emerging_keywords": emerging_keywords[:10],
-            "declining_keywords": declining_keywords[:10]
+            "emerging_keywords": emerging_keywords,
+            "declining_keywords": declining_keywords
         }
 
-    def _calculate_temporal_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _shifted_keywords(self, counts: Counter, other_counts: Counter) -> List[str]:
+        """
+        Keywords among a half's 30 most frequent that are over twice as frequent as in the other half
+
+        Args:
+            counts: Headline token counts of this half
+            other_counts: Headline token counts of the other half
+
+        Returns:
+            Up to 10 keywords (at least 5 occurrences), most frequent first
+        """
+        shifted = [
+            word for word, count in counts.most_common(30)
+            if count >= 5 and count > other_counts[word] * 2 and word not in _STOPWORDS
+        ]
+        return shifted[:10]
+
+    def _calculate_temporal_metrics(self, totals: Dict) -> Dict:
         """Calculate time-based comparison metrics"""
         logger.info("Calculating News temporal metrics...")
 
-        # Get dates
-        dates = []
-        for article in articles:
-            dt = self._parse_date(article.published_at)
-            if dt:
-                dates.append(dt)
+        dates = totals["dates"]
 
-        if not dates:
+        if not len(dates):
             return {
                 "first_article_date": "unknown",
                 "articles_last_month": 0,
@@ -329,18 +612,20 @@ class NewsMetricsCalculator:
                 "growth_rate_early_vs_late": 0.0
             }
 
-        first_date = min(dates)
-        first_date_str = first_date.strftime("%Y-%m-%d")
+        # Compare as integer epoch microseconds (datetime64[us] viewed as int64, no unit conversions)
+        epoch = dates.view(np.int64)
+        first_epoch = int(epoch.min())
+        first_date_str = str(np.datetime64(first_epoch, "us").astype("datetime64[D]"))
 
-        # Current time reference
-        now = datetime.now()
-        one_month_ago = now.timestamp() - (30 * 24 * 60 * 60)
-        three_months_ago = now.timestamp() - (90 * 24 * 60 * 60)
-        three_months_after_first = first_date.timestamp() + (90 * 24 * 60 * 60)
+        # Current time reference (naive local time, like the parsed dates)
+        now = int(np.datetime64(datetime.now(), "us").view(np.int64))
+        one_month_ago = now - 30 * _MICROSECONDS_PER_DAY
+        three_months_ago = now - 90 * _MICROSECONDS_PER_DAY
+        three_months_after_first = first_epoch + 90 * _MICROSECONDS_PER_DAY
 
-        articles_last_month = sum(1 for dt in dates if dt.timestamp() >= one_month_ago)
-        articles_last_3_months = sum(1 for dt in dates if dt.timestamp() >= three_months_ago)
-        articles_first_3_months = sum(1 for dt in dates if dt.timestamp() <= three_months_after_first)
+        articles_last_month = int(np.count_nonzero(epoch >= one_month_ago))
+        articles_last_3_months = int(np.count_nonzero(epoch >= three_months_ago))
+        articles_first_3_months = int(np.count_nonzero(epoch <= three_months_after_first))
 
         # Growth rate
         if articles_first_3_months > 0:
@@ -356,13 +641,13 @@ class NewsMetricsCalculator:
             "growth_rate_early_vs_late": growth_rate
         }
 
-    def _calculate_quality_metrics(self, articles: List[NewsArticle]) -> Dict:
+    def _calculate_quality_metrics(self, totals: Dict) -> Dict:
         """Calculate data quality metrics"""
         logger.info("Calculating News data quality metrics...")
 
-        total = len(articles)
-        with_content = sum(1 for a in articles if a.content)
-        with_description = sum(1 for a in articles if a.description)
+        total = totals["total_articles"]
+        with_content = totals["with_content"]
+        with_description = totals["with_description"]
         coverage = ((with_content + with_description) / (total * 2)) * 100
 
         return {
@@ -1,24 +1,75 @@
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import Dict, Iterable, List, Tuple, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from collections import defaultdict, Counter
+from sqlalchemy.engine import Row
+from sqlalchemy import func, case, select
+from array import array
+from collections import Counter
+from enum import IntEnum
 import numpy as np
+import ahocorasick
+import copy
 import re
+import time
 import logging
 
+from ..config import settings
 from ..models import Paper
 
 logger = logging.getLogger(__name__)
 
+# Topic keyword tokens: whole lowercase words of 4+ letters
+_TOKEN_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Common words excluded from topic keywords
+_STOPWORDS = frozenset({
+    "this", "that", "with", "from", "were", "have", "been", "their",
+    "which", "these", "more", "other", "such", "into", "only", "also",
+    "than", "some", "time", "very", "when", "them", "they", "there",
+    "where", "what", "about", "after", "before", "would", "could",
+    "should", "being", "between", "through", "during", "using"
+})
+
+# Venue types, matched anywhere in the lowercased venue name (venues matching neither
+# count as journals / academic respectively)
+_CONFERENCE_VENUE_RE = re.compile("conference|symposium|workshop|proceedings|meeting")
+_INDUSTRY_VENUE_RE = re.compile("industrial|applied|engineering|technology|biotechnology")
+
+
+class _TrendEnum(IntEnum):
+    """Integer-coded trend, serialized as its lowercase name"""
+
+    def __str__(self):
+        return self.name.lower()
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+class VelocityTrend(_TrendEnum):
+    """Publication velocity trend"""
+    INCREASING = 1
+    STABLE = 2
+    DECREASING = 3
+    PEAK_REACHED = 4
+    INSUFFICIENT_DATA = 5
+
+
+class ResearchTypeTrend(_TrendEnum):
+    """Shift between basic and applied research over time"""
+    TOWARD_APPLIED = 1
+    TOWARD_BASIC = 2
+    STABLE = 3
+
 
 @dataclass
 class MetricsSnapshot:
     """Snapshot of all calculated metrics"""
     # Publication velocity metrics
     publication_velocity: Dict[int, int]  # year -> count
-    velocity_trend: str  # "increasing", "decreasing", "stable", "peak_reached"
+    velocity_trend: VelocityTrend
     avg_papers_per_year: float
     peak_year: int
     peak_count: int
@@ -35,7 +86,7 @@ class MetricsSnapshot:
     basic_research_percentage: float
     applied_research_percentage: float
     mixed_research_percentage: float
-    research_type_trend: str  # "toward_applied", "toward_basic", "stable"
+    research_type_trend: ResearchTypeTrend
 
     # Topic/keyword metrics
     top_keywords: List[Tuple[str, int]]  # (keyword, frequency)
@@ -59,9 +110,101 @@ class MetricsSnapshot:
     papers_with_pdf: int
     coverage_percentage: float
 
+    @cached_property
+    def current_year(self) -> int:
+        """Latest year with publications (0 if no velocity data)"""
+        return max(self.publication_velocity) if self.publication_velocity else 0
+
+    @cached_property
+    def years_since_peak(self) -> int:
+        """Years elapsed between the peak year and the latest publication year"""
+        return self.current_year - self.peak_year
+
     def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization
+
+        Field values are shared with the snapshot, not deep-copied as by asdict();
+        the dict is meant to be serialized, not modified in place.
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["velocity_trend"] = str(self.velocity_trend)
+        data["research_type_trend"] = str(self.research_type_trend)
+        return data
+
+
+@dataclass
+class PaperColumns:
+    """Per-paper values as parallel columns (one entry per paper, in year order)"""
+    years: np.ndarray  # int64, 0 when unknown
+    citations: np.ndarray  # int64, 0 when unknown
+    has_citations: np.ndarray  # bool, False when citation_count is NULL
+    titles: List[str]  # lowercased, "" when missing (likewise abstracts and venues)
+    abstracts: List[str]
+    venues: List[str]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Row]) -> "PaperColumns":
+        """
+        Collect streamed (year, citation_count, title, abstract, venue) rows into columns
+
+        Text is lowercased here, once per paper, for all the keyword matching downstream.
+        """
+        years = array("q")
+        citations = array("q")
+        has_citations = array("B")
+        titles = []
+        abstracts = []
+        venues = []
+
+        for year, citation_count, title, abstract, venue in rows:
+            years.append(year or 0)
+            citations.append(citation_count or 0)
+            has_citations.append(citation_count is not None)
+            titles.append(title.lower() if title else "")
+            abstracts.append(abstract.lower() if abstract else "")
+            venues.append(venue.lower() if venue else "")
+
+        return cls(
+            years=np.frombuffer(years, dtype=np.int64),
+            citations=np.frombuffer(citations, dtype=np.int64),
+            has_citations=np.frombuffer(has_citations, dtype=np.bool_),
+            titles=titles,
+            abstracts=abstracts,
+            venues=venues
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+
+# Last snapshot per technology: technology_id -> (cache key, monotonic time computed, snapshot).
+# The key (paper count, max paper id, max created_at) changes whenever papers are added or
+# removed; collected papers are never updated in place
+_snapshot_cache: Dict[int, Tuple[Tuple, float, MetricsSnapshot]] = {}
+
+
+def _build_keyword_automaton(basic_keywords: List[str], applied_keywords: List[str]) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton over both research type keyword lists
+
+    Each keyword maps to its own bit: basic keywords take the low len(basic_keywords)
+    bits and applied keywords the bits above, so OR-ing the values reported by one
+    scan of a text gives the set of keywords it contains (overlapping matches
+    included) and each score is a popcount.
+
+    Args:
+        basic_keywords: Basic science keywords
+        applied_keywords: Applied research keywords
+
+    Returns:
+        Automaton ready for iter()
+    """
+    automaton = ahocorasick.Automaton()
+    for bit, keyword in enumerate([*basic_keywords, *applied_keywords]):
+        automaton.add_word(keyword, 1 << bit)
+    automaton.make_automaton()
+    return automaton
 
 
 class PaperMetricsCalculator:
@@ -86,40 +229,67 @@ class PaperMetricsCalculator:
         "market", "industry", "economic", "practical", "clinical", "pilot scale"
     ]
 
+    # Both lists compiled once into a single multi-pattern matcher
+    _RESEARCH_TYPE_AUTOMATON = _build_keyword_automaton(BASIC_SCIENCE_KEYWORDS, APPLIED_RESEARCH_KEYWORDS)
+    _BASIC_KEYWORD_BITS = len(BASIC_SCIENCE_KEYWORDS)
+    _BASIC_KEYWORD_MASK = (1 << _BASIC_KEYWORD_BITS) - 1
+
     def __init__(self, db: Session):
         self.db = db
 
-    def calculate_metrics(self, technology_id: int) -> MetricsSnapshot:
+    def calculate_metrics(self, technology_id: int, force: bool = False) -> MetricsSnapshot:
         """
         Calculate all metrics for a technology
 
         Args:
             technology_id: ID of technology to analyze
+            force: Recalculate even if a cached snapshot of the same papers exists
 
         Returns:
             MetricsSnapshot with all calculated metrics
         """
         logger.info(f"Starting metrics calculation for technology {technology_id}")
 
-        # Fetch all papers for this technology
-        papers = self.db.query(Paper)\
-            .filter(Paper.technology_id == technology_id)\
-            .order_by(Paper.year)\
-            .all()
+        # Reuse the last snapshot if the technology's papers have not changed since
+        cache_key = self._fetch_cache_key(technology_id)
+        if not force:
+            cached = self._get_cached_snapshot(technology_id, cache_key)
+            if cached is not None:
+                logger.info(f"Using cached metrics for technology {technology_id}")
+                return cached
+
+        # Per-year counts (and abstract/PDF coverage) are aggregated in the database
+        year_rows = self._fetch_year_aggregates(technology_id)
+        total_papers = sum(count for _, count, _, _ in year_rows)
 
-        if not papers:
+        if not total_papers:
             raise ValueError(f"No papers found for technology {technology_id}")
 
-        logger.info(f"Found {len(papers)} papers to analyze")
+        logger.info(f"Found {total_papers} papers to analyze")
+
+        # Text/citation metrics need per-paper values: stream only those columns into arrays.
+        # The rows are read-only, so they are fetched through Core, bypassing ORM result processing
+        stmt = select(
+            Paper.year,
+            Paper.citation_count,
+            Paper.title,
+            Paper.abstract,
+            Paper.venue
+        )\
+            .where(Paper.technology_id == technology_id)\
+            .order_by(Paper.year)\
+            .execution_options(yield_per=2000)
+        rows = self.db.connection().execute(stmt)
+        papers = PaperColumns.from_rows(rows)
 
         # Calculate each metric category
-        velocity_metrics = self._calculate_velocity_metrics(papers)
+        velocity_metrics = self._calculate_velocity_metrics(year_rows, total_papers)
         citation_metrics = self._calculate_citation_metrics(papers)
         research_type_metrics = self._calculate_research_type_distribution(papers)
         topic_metrics = self._calculate_topic_metrics(papers)
         venue_metrics = self._calculate_venue_distribution(papers)
-        temporal_metrics = self._calculate_temporal_metrics(papers)
-        quality_metrics = self._calculate_quality_metrics(papers)
+        temporal_metrics = self._calculate_temporal_metrics(year_rows)
+        quality_metrics = self._calculate_quality_metrics(year_rows, total_papers)
 
         # Combine into snapshot
         metrics = MetricsSnapshot(
@@ -132,21 +302,90 @@ class PaperMetricsCalculator:
             **quality_metrics
         )
 
+        self._store_cached_snapshot(technology_id, cache_key, metrics)
+
         logger.info("Metrics calculation completed")
         return metrics
 
-    def _calculate_velocity_metrics(self, papers: List[Paper]) -> Dict:
+    def _fetch_cache_key(self, technology_id: int) -> Tuple:
+        """
+        Fetch a cheap fingerprint of a technology's papers in one SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            Tuple of (paper_count, max_paper_id, max_created_at)
+        """
+        row = self.db.query(
+            func.count(Paper.id),
+            func.max(Paper.id),
+            func.max(Paper.created_at)
+        )\
+            .filter(Paper.technology_id == technology_id)\
+            .one()
+
+        return tuple(row)
+
+    def _get_cached_snapshot(self, technology_id: int, cache_key: Tuple) -> Optional[MetricsSnapshot]:
+        """
+        Get a cached snapshot computed from the same papers within the TTL
+
+        The TTL bounds staleness of the metrics relative to the current year (e.g.
+        recent_velocity, papers_last_year), which change even when the papers do not.
+
+        Returns:
+            A copy of the cached snapshot, or None
+        """
+        entry = _snapshot_cache.get(technology_id)
+        if entry is None:
+            return None
+
+        key, computed_at, snapshot = entry
+        if key != cache_key or time.monotonic() - computed_at > settings.hype_cycle_paper_metrics_cache_ttl_seconds:
+            return None
+
+        return copy.deepcopy(snapshot)
+
+    def _store_cached_snapshot(self, technology_id: int, cache_key: Tuple, snapshot: MetricsSnapshot):
+        """Cache a freshly computed snapshot (a copy, so callers may modify theirs)"""
+        if settings.hype_cycle_paper_metrics_cache_ttl_seconds > 0:
+            _snapshot_cache[technology_id] = (cache_key, time.monotonic(), copy.deepcopy(snapshot))
+
+    def _fetch_year_aggregates(self, technology_id: int) -> List[Tuple[Optional[int], int, int, int]]:
+        """
+        Count papers per publication year in one grouped SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            List of (year, paper_count, with_abstract_count, with_pdf_count) tuples in year
+            order; papers without a year are grouped under None
+        """
+        has_abstract = func.coalesce(Paper.abstract, "") != ""
+        has_pdf = func.coalesce(Paper.open_access_pdf, "") != ""
+
+        rows = self.db.query(
+            Paper.year,
+            func.count(Paper.id),
+            func.sum(case((has_abstract, 1), else_=0)),
+            func.sum(case((has_pdf, 1), else_=0))
+        )\
+            .filter(Paper.technology_id == technology_id)\
+            .group_by(Paper.year)\
+            .order_by(Paper.year)\
+            .all()
+
+        return [tuple(row) for row in rows]
+
+    def _calculate_velocity_metrics(self, year_rows: List[Tuple], total_papers: int) -> Dict:
         """Calculate publication velocity and trends"""
         logger.info("Calculating velocity metrics...")
 
-        # Group by year
-        year_counts = defaultdict(int)
-        for paper in papers:
-            if paper.year:
-                year_counts[paper.year] += 1
-
-        # Sort years
-        sorted_years = sorted(year_counts.keys())
+        # Per-year counts, already grouped and ordered by year in SQL
+        year_counts = {year: count for year, count, _, _ in year_rows if year}
+        sorted_years = list(year_counts)
 
         if not sorted_years:
             raise ValueError("No papers with year information")
@@ -161,15 +400,15 @@ class PaperMetricsCalculator:
             earlier_3yr = sum(year_counts[y] for y in sorted_years[:3]) / 3
 
             if recent_3yr > earlier_3yr * 1.2:
-                trend = "increasing"
+                trend = VelocityTrend.INCREASING
             elif recent_3yr < earlier_3yr * 0.8:
-                trend = "decreasing"
+                trend = VelocityTrend.DECREASING
             elif peak_year in sorted_years[-3:]:
-                trend = "peak_reached"
+                trend = VelocityTrend.PEAK_REACHED
             else:
-                trend = "stable"
+                trend = VelocityTrend.STABLE
         else:
-            trend = "insufficient_data"
+            trend = VelocityTrend.INSUFFICIENT_DATA
 
         # Recent velocity (last 2 years)
         current_year = datetime.now().year
@@ -179,19 +418,21 @@ class PaperMetricsCalculator:
         return {
             "publication_velocity": dict(year_counts),
             "velocity_trend": trend,
-            "avg_papers_per_year": len(papers) / max(len(sorted_years), 1),
+            "avg_papers_per_year": total_papers / max(len(sorted_years), 1),
             "peak_year": peak_year,
             "peak_count": peak_count,
             "recent_velocity": recent_velocity
         }
 
-    def _calculate_citation_metrics(self, papers: List[Paper]) -> Dict:
+    def _calculate_citation_metrics(self, papers: PaperColumns) -> Dict:
         """Calculate citation-based metrics"""
         logger.info("Calculating citation metrics...")
 
-        citations = [p.citation_count for p in papers if p.citation_count is not None]
+        # Papers with a known citation count (and their years, 0 when unknown)
+        citations = papers.citations[papers.has_citations]
+        years = papers.years[papers.has_citations]
 
-        if not citations:
+        if not citations.size:
             return {
                 "total_citations": 0,
                 "avg_citations_per_paper": 0.0,
@@ -201,27 +442,22 @@ class PaperMetricsCalculator:
             }
 
         # Basic stats
-        total = sum(citations)
-        avg = total / len(citations)
-        median = float(np.median(citations))
+        total = int(citations.sum())
+        avg = total / citations.size
+
+        # Median and 90th percentile from one partitioning pass over the citations
+        median, percentile_90 = np.percentile(citations, (50, 90)).tolist()
 
         # Highly cited threshold (top 10% or 100+ citations)
-        threshold = max(100, np.percentile(citations, 90))
-        highly_cited = sum(1 for c in citations if c >= threshold)
-
-        # Citation growth rate (year-over-year)
-        year_avg_citations = {}
-        for paper in papers:
-            if paper.year and paper.citation_count is not None:
-                if paper.year not in year_avg_citations:
-                    year_avg_citations[paper.year] = []
-                year_avg_citations[paper.year].append(paper.citation_count)
-
-        # Calculate growth rate
-        if len(year_avg_citations) >= 2:
-            years = sorted(year_avg_citations.keys())
-            recent_avg = np.mean(year_avg_citations[years[-1]])
-            earlier_avg = np.mean(year_avg_citations[years[-2]])
+        threshold = max(100, percentile_90)
+        highly_cited = int(np.count_nonzero(citations >= threshold))
+
+        # Citation growth rate: average citations of the latest year vs the year before
+        dated = years > 0
+        citation_years = np.unique(years[dated])
+        if citation_years.size >= 2:
+            recent_avg = citations[years == citation_years[-1]].mean()
+            earlier_avg = citations[years == citation_years[-2]].mean()
             growth_rate = ((recent_avg - earlier_avg) / max(earlier_avg, 1)) * 100
         else:
             growth_rate = 0.0
@@ -234,7 +470,7 @@ class PaperMetricsCalculator:
             "highly_cited_count": highly_cited
         }
 
-    def _calculate_research_type_distribution(self, papers: List[Paper]) -> Dict:
+    def _calculate_research_type_distribution(self, papers: PaperColumns) -> Dict:
         """
         Classify papers as basic science vs applied research
 
@@ -245,18 +481,15 @@ class PaperMetricsCalculator:
         """
         logger.info("Calculating research type distribution...")
 
-        basic_count = 0
-        applied_count = 0
-        mixed_count = 0
+        # Classify every paper once; the trend reuses the same classifications
+        classifications = [
+            self._classify_research_type(title, abstract)
+            for title, abstract in zip(papers.titles, papers.abstracts)
+        ]
 
-        for paper in papers:
-            classification = self._classify_research_type(paper)
-            if classification == "basic":
-                basic_count += 1
-            elif classification == "applied":
-                applied_count += 1
-            else:
-                mixed_count += 1
+        basic_count = classifications.count("basic")
+        applied_count = classifications.count("applied")
+        mixed_count = len(classifications) - basic_count - applied_count
 
         total = len(papers)
         basic_pct = (basic_count / total) * 100
@@ -265,21 +498,21 @@ class PaperMetricsCalculator:
 
         # Determine trend: compare first half vs second half
         midpoint = total // 2
-        first_half = papers[:midpoint]
-        second_half = papers[midpoint:]
+        first_half = classifications[:midpoint]
+        second_half = classifications[midpoint:]
 
-        first_applied = sum(1 for p in first_half if self._classify_research_type(p) == "applied")
-        second_applied = sum(1 for p in second_half if self._classify_research_type(p) == "applied")
+        first_applied = first_half.count("applied")
+        second_applied = second_half.count("applied")
 
         first_applied_pct = (first_applied / len(first_half)) * 100 if first_half else 0
         second_applied_pct = (second_applied / len(second_half)) * 100 if second_half else 0
 
         if second_applied_pct > first_applied_pct + 10:
-            trend = "toward_applied"
+            trend = ResearchTypeTrend.TOWARD_APPLIED
         elif second_applied_pct < first_applied_pct - 10:
-            trend = "toward_basic"
+            trend = ResearchTypeTrend.TOWARD_BASIC
         else:
-            trend = "stable"
+            trend = ResearchTypeTrend.STABLE
 
         logger.info(f"Research type: Basic={basic_pct:.1f}%, Applied={applied_pct:.1f}%, Mixed={mixed_pct:.1f}%")
 
@@ -290,16 +523,24 @@ class PaperMetricsCalculator:
             "research_type_trend": trend
         }
 
-    def _classify_research_type(self, paper: Paper) -> str:
+    def _classify_research_type(self, title: str, abstract: str) -> str:
         """
         Classify a single paper as basic, applied, or mixed
 
+        Args:
+            title: Lowercased paper title
+            abstract: Lowercased paper abstract
+
         Returns: "basic", "applied", or "mixed"
         """
-        text = (paper.title or "").lower() + " " + (paper.abstract or "").lower()
+        text = title + " " + abstract
 
-        basic_score = sum(1 for kw in self.BASIC_SCIENCE_KEYWORDS if kw in text)
-        applied_score = sum(1 for kw in self.APPLIED_RESEARCH_KEYWORDS if kw in text)
+        # One pass over the text; a keyword counts once however often it occurs
+        matched = 0
+        for _, keyword_bit in self._RESEARCH_TYPE_AUTOMATON.iter(text):
+            matched |= keyword_bit
+        basic_score = (matched & self._BASIC_KEYWORD_MASK).bit_count()
+        applied_score = (matched >> self._BASIC_KEYWORD_BITS).bit_count()
 
         # Classification logic
         if basic_score > applied_score * 2:
@@ -309,57 +550,37 @@ class PaperMetricsCalculator:
         else:
             return "mixed"
 
-    def _calculate_topic_metrics(self, papers: List[Paper]) -> Dict:
+    def _calculate_topic_metrics(self, papers: PaperColumns) -> Dict:
         """Extract and analyze keywords from titles/abstracts"""
         logger.info("Calculating topic metrics...")
 
-        all_text = []
-        for paper in papers:
-            if paper.abstract:
-                all_text.append(paper.abstract.lower())
-            if paper.title:
-                all_text.append(paper.title.lower())
-
-        # Extract keywords (simple approach: frequent meaningful words)
-        words = Counter()
-        for text in all_text:
-            # Remove common words, extract meaningful terms (4+ letters)
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            words.update(tokens)
-
-        # Filter out common stopwords
-        stopwords = {
-            "this", "that", "with", "from", "were", "have", "been", "their",
-            "which", "these", "more", "other", "such", "into", "only", "also",
-            "than", "some", "time", "very", "when", "them", "they", "there",
-            "where", "what", "about", "after", "before", "would", "could",
-            "should", "being", "between", "through", "during", "using"
-        }
-        top_keywords = [(w, c) for w, c in words.most_common(50) if w not in stopwords]
-
-        # For emerging/declining keywords, compare recent vs old papers
-        # Split papers into two periods
+        # Tokenize each title and abstract once, feeding both the overall counts and the
+        # counts of the paper's period (old/recent half, papers are ordered by year)
+        # (Counter hashing beats sorting token arrays with np.unique by ~3x here)
         midpoint = len(papers) // 2
-        old_papers = papers[:midpoint]
-        recent_papers = papers[midpoint:]
-
+        words = Counter()
         old_words = Counter()
         recent_words = Counter()
 
-        for paper in old_papers:
-            text = (paper.title or "").lower() + " " + (paper.abstract or "").lower()
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            old_words.update(tokens)
+        for index, (title, abstract) in enumerate(zip(papers.titles, papers.abstracts)):
+            # Remove common words, extract meaningful terms (4+ letters)
+            title_tokens = _TOKEN_RE.findall(title)
+            abstract_tokens = _TOKEN_RE.findall(abstract)
+
+            words.update(abstract_tokens)
+            words.update(title_tokens)
 
-        for paper in recent_papers:
-            text = (paper.title or "").lower() + " " + (paper.abstract or "").lower()
-            tokens = re.findall(r'\b[a-z]{4,}\b', text)
-            recent_words.update(tokens)
+            period_words = old_words if index < midpoint else recent_words
+            period_words.update(title_tokens)
+            period_words.update(abstract_tokens)
+
+        # Filter out common stopwords
+        top_keywords = [(w, c) for w, c in words.most_common(50) if w not in _STOPWORDS]
 
         # Emerging: words that appear much more frequently in recent papers
         emerging_keywords = []
         for word, recent_count in recent_words.most_common(30):
-            if word not in stopwords:
+            if word not in _STOPWORDS:
                 old_count = old_words.get(word, 0)
                 if recent_count > old_count * 2 and recent_count >= 10:
                     emerging_keywords.append(word)
@@ -367,7 +588,7 @@ class PaperMetricsCalculator:
         # Declining: words that appeared frequently in old but not in recent
         declining_keywords = []
         for word, old_count in old_words.most_common(30):
-            if word not in stopwords:
+            if word not in _STOPWORDS:
                 recent_count = recent_words.get(word, 0)
                 if old_count > recent_count * 2 and old_count >= 10:
                     declining_keywords.append(word)
@@ -378,29 +599,22 @@ class PaperMetricsCalculator:
             "declining_keywords": declining_keywords[:10]
         }
 
-    def _calculate_venue_distribution(self, papers: List[Paper]) -> Dict:
+    def _calculate_venue_distribution(self, papers: PaperColumns) -> Dict:
         """Analyze publication venues"""
         logger.info("Calculating venue distribution...")
 
-        # Keywords to identify venue types
-        academic_keywords = ["journal", "proceedings", "transactions", "letters", "review"]
-        industry_keywords = ["industrial", "applied", "engineering", "technology", "biotechnology"]
-        conference_keywords = ["conference", "symposium", "workshop", "proceedings", "meeting"]
-
         academic_count = 0
         industry_count = 0
         conference_count = 0
         journal_count = 0
 
-        for paper in papers:
-            venue = (paper.venue or "").lower()
-
-            if any(kw in venue for kw in conference_keywords):
+        for venue in papers.venues:
+            if _CONFERENCE_VENUE_RE.search(venue):
                 conference_count += 1
             else:
                 journal_count += 1
 
-            if any(kw in venue for kw in industry_keywords):
+            if _INDUSTRY_VENUE_RE.search(venue):
                 industry_count += 1
             else:
                 academic_count += 1
@@ -414,20 +628,21 @@ class PaperMetricsCalculator:
             "journal_percentage": (journal_count / total) * 100
         }
 
-    def _calculate_temporal_metrics(self, papers: List[Paper]) -> Dict:
+    def _calculate_temporal_metrics(self, year_rows: List[Tuple]) -> Dict:
         """Calculate time-based comparison metrics"""
         logger.info("Calculating temporal metrics...")
 
         current_year = datetime.now().year
+        # One (year, count) pair per publication year, in year order (see _fetch_year_aggregates)
+        year_counts = [(year, count) for year, count, _, _ in year_rows if year]
 
-        papers_last_year = sum(1 for p in papers if p.year == current_year - 1)
-        papers_last_2_years = sum(1 for p in papers if p.year and p.year >= current_year - 2)
+        papers_last_year = sum(count for year, count in year_counts if year == current_year - 1)
+        papers_last_2_years = sum(count for year, count in year_counts if year >= current_year - 2)
 
         # Get earliest years
-        years = sorted([p.year for p in papers if p.year])
-        if years:
-            earliest_year = years[0]
-            papers_first_2_years = sum(1 for p in papers if p.year and p.year <= earliest_year + 2)
+        if year_counts:
+            earliest_year = year_counts[0][0]
+            papers_first_2_years = sum(count for year, count in year_counts if year <= earliest_year + 2)
 
             # Growth rate comparison
             if papers_first_2_years > 0:
@@ -445,13 +660,12 @@ class PaperMetricsCalculator:
             "growth_rate_early_vs_late": growth_rate
         }
 
-    def _calculate_quality_metrics(self, papers: List[Paper]) -> Dict:
+    def _calculate_quality_metrics(self, year_rows: List[Tuple], total: int) -> Dict:
         """Calculate data quality and coverage metrics"""
         logger.info("Calculating quality metrics...")
 
-        total = len(papers)
-        with_abstracts = sum(1 for p in papers if p.abstract)
-        with_pdf = sum(1 for p in papers if p.open_access_pdf)
+        with_abstracts = sum(abstract_count for _, _, abstract_count, _ in year_rows)
+        with_pdf = sum(pdf_count for _, _, _, pdf_count in year_rows)
 
         coverage = ((with_abstracts + with_pdf) / (total * 2)) * 100
 
@@ -1,16 +1,23 @@
-from typing import Dict, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict, astuple
+from functools import lru_cache
+import numpy as np
 import logging
 
 from ..models.hype_cycle_phase import HypeCyclePhase, PhaseCharacteristics
-from .patent_metrics_calculator import PatentMetricsSnapshot
+from .patent_metrics_calculator import PatentMetricsSnapshot, VelocityTrend
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatentRuleThresholds:
-    """Configurable thresholds for patent-based rule evaluation"""
+    """
+    Configurable thresholds for patent-based rule evaluation
+
+    Immutable: engines inline the values into their compiled rule predicates and score
+    cache key, so a different threshold set needs a new PatentRuleThresholds and engine.
+    """
 
     # Volume thresholds
     low_patent_count: int = 50  # Below this = early stage
@@ -45,276 +52,206 @@ class PatentRuleThresholds:
     high_design_pct: float = 20.0  # High design = product focus
 
 
-class PatentHypeCycleRuleEngine:
-    """Rule-based engine for determining Hype Cycle phase from patent data"""
-
-    def __init__(self, thresholds: PatentRuleThresholds = None):
-        self.thresholds = thresholds or PatentRuleThresholds()
-
-    def determine_phase(self, metrics: PatentMetricsSnapshot) -> Tuple[HypeCyclePhase, float, Dict, str]:
-        """
-        Determine Hype Cycle phase from patent metrics
-
-        Args:
-            metrics: Calculated patent metrics snapshot
-
-        Returns:
-            Tuple of (phase, confidence, rule_scores, rationale)
-        """
-        logger.info("Determining Hype Cycle phase from patent metrics...")
-
-        # Score each phase based on rules
-        phase_scores = {
-            HypeCyclePhase.TECHNOLOGY_TRIGGER: self._score_technology_trigger(metrics),
-            HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS: self._score_peak_inflated(metrics),
-            HypeCyclePhase.TROUGH_DISILLUSIONMENT: self._score_trough(metrics),
-            HypeCyclePhase.SLOPE_ENLIGHTENMENT: self._score_slope(metrics),
-            HypeCyclePhase.PLATEAU_PRODUCTIVITY: self._score_plateau(metrics)
-        }
-
-        # Find highest scoring phase
-        best_phase = max(phase_scores, key=phase_scores.get)
-        confidence = phase_scores[best_phase]
-
-        logger.info(f"Patent phase determined: {best_phase.value} (confidence: {confidence:.2f})")
-
-        # Generate rationale
-        rationale = self._generate_rationale(best_phase, metrics, phase_scores)
-
-        # Convert enum keys to strings for JSON serialization
-        phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
-
-        return best_phase, confidence, phase_scores_str, rationale
-
-    def _score_technology_trigger(self, m: PatentMetricsSnapshot) -> float:
-        """
-        Score for Technology Trigger phase
-
-        Patent Indicators:
-        - Few patents total (<50)
-        - Mainly academic/research institutions (>50% academic)
-        - Low forward citations (patents too new)
-        - Few assignees (concentrated, early players)
-        - First patent recent (<5 years)
-        - High utility patent percentage (R&D focus)
-        """
-        score = 0.0
-
-        # Few patents total
-        if m.total_patents < self.thresholds.low_patent_count:
-            score += 0.25
-
-        # High academic percentage
-        if m.academic_percentage > self.thresholds.high_academic_pct:
-            score += 0.25
-
-        # Low forward citations (new patents not yet cited)
-        if m.avg_forward_citations < 2:
-            score += 0.15
-
-        # Young technology
-        if m.technology_age_years < self.thresholds.young_technology_years:
-            score += 0.15
-
-        # Few unique assignees (early entrants only)
-        if m.unique_assignees_count < 20:
-            score += 0.1
-
-        # Low geographic spread
-        if m.unique_countries < self.thresholds.low_country_spread:
-            score += 0.1
-
-        return min(score, 1.0)
-
-    def _score_peak_inflated(self, m: PatentMetricsSnapshot) -> float:
-        """
-        Score for Peak of Inflated Expectations
-
-        Patent Indicators:
-        - Rapid patent growth (>50% YoY)
-        - Many new entrants (high new_entrants rate)
-        - Shift from academic to corporate (40-60% corporate)
-        - Peak year recent or current
-        - Growing geographic spread
-        - Low HHI (many players competing)
-        """
-        score = 0.0
-
-        # Check if at or near peak
-        if m.patent_velocity:
-            current_year = max(m.patent_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if years_since_peak <= self.thresholds.recent_peak_years:
-                score += 0.25
-
-        # Velocity increasing or at peak
-        if m.velocity_trend in ["increasing", "peak_reached"]:
-            score += 0.25
-
-        # Mixed corporate/academic (transition phase)
-        if 40 <= m.corporate_percentage <= 70:
-            score += 0.15
-
-        # Low concentration (many competitors entering)
-        if m.assignee_concentration_hhi < self.thresholds.low_hhi:
-            score += 0.15
-
-        # High recent activity
-        if m.recent_velocity > m.avg_patents_per_year * 1.2:
-            score += 0.1
-
-        # Growing number of countries
-        if self.thresholds.low_country_spread < m.unique_countries < self.thresholds.high_country_spread:
-            score += 0.1
-
-        return min(score, 1.0)
-
-    def _score_trough(self, m: PatentMetricsSnapshot) -> float:
-        """
-        Score for Trough of Disillusionment
-
-        Patent Indicators:
-        - Declining patent velocity
-        - Recent peak followed by decline
-        - Some assignees exiting (concentration may increase)
-        - Forward citations slowing
-        - Corporate still dominant but fewer new entrants
-        """
-        score = 0.0
-
-        # Declining velocity
-        if m.velocity_trend == "decreasing":
-            score += 0.30
-
-        # Peak was recent but now declining (1-5 years ago)
-        if m.patent_velocity:
-            current_year = max(m.patent_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if 1 <= years_since_peak <= 5:
-                score += 0.25
-
-        # Recent patents significantly less than peak
-        if m.patents_last_year < m.peak_count * 0.6:
-            score += 0.15
-
-        # Low citation ratio (patents cite more than they're cited)
-        if m.citation_ratio < self.thresholds.low_citation_ratio:
-            score += 0.15
-
-        # Moderate concentration (some consolidation)
-        if self.thresholds.low_hhi <= m.assignee_concentration_hhi <= self.thresholds.high_hhi:
-            score += 0.1
-
-        # New entrants declining (check if recent years have fewer new entrants)
-        if m.new_entrants_by_year:
-            recent_years = sorted(m.new_entrants_by_year.keys())[-3:]
-            if len(recent_years) >= 2:
-                recent_entrants = sum(m.new_entrants_by_year.get(y, 0) for y in recent_years[-2:])
-                earlier_entrants = sum(m.new_entrants_by_year.get(y, 0) for y in recent_years[:-2]) if len(recent_years) > 2 else recent_entrants
-                if recent_entrants < earlier_entrants * 0.8:
-                    score += 0.05
-
-        return min(score, 1.0)
-
-    def _score_slope(self, m: PatentMetricsSnapshot) -> float:
-        """
-        Score for Slope of Enlightenment
-
-        Patent Indicators:
-        - Stable or gradual patent increase after decline
-        - Corporate dominant (70-85%)
-        - Selective new entrants (quality over quantity)
-        - Stable citation patterns
-        - Moderate concentration (established players)
-        - Mix of utility and design patents (products emerging)
-        """
-        score = 0.0
-
-        # Stable velocity
-        if m.velocity_trend == "stable":
-            score += 0.25
-
-        # High corporate percentage (industry-led)
-        if 70 <= m.corporate_percentage < 90:
-            score += 0.20
+# Phase order shared by the rows of the rule weight matrix
+PHASE_ORDER = (
+    HypeCyclePhase.TECHNOLOGY_TRIGGER,
+    HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS,
+    HypeCyclePhase.TROUGH_DISILLUSIONMENT,
+    HypeCyclePhase.SLOPE_ENLIGHTENMENT,
+    HypeCyclePhase.PLATEAU_PRODUCTIVITY,
+)
+
+# Weight of each rule (columns, in _RULE_FEATURES_SOURCE order) per phase (rows)
+RULE_WEIGHTS = np.array([
+    # Technology Trigger: few patents, academic, low citations, young, few assignees, few countries
+    [0.25, 0.25, 0.15, 0.15, 0.10, 0.10] + [0.0] * 25,
+    # Peak of Inflated Expectations: recent peak, rising velocity, mixed assignees, low HHI, recent activity, spreading
+    [0.0] * 6 + [0.25, 0.25, 0.15, 0.15, 0.10, 0.10] + [0.0] * 19,
+    # Trough of Disillusionment: declining velocity, peak 1-5 years ago, below peak, low citation ratio,
+    # moderate HHI, fewer new entrants
+    [0.0] * 12 + [0.30, 0.25, 0.15, 0.15, 0.10, 0.05] + [0.0] * 13,
+    # Slope of Enlightenment: stable velocity, corporate-led, peak 4-10 years ago, moderate HHI, international,
+    # moderate citation ratio
+    [0.0] * 18 + [0.25, 0.20, 0.20, 0.15, 0.10, 0.10] + [0.0] * 7,
+    # Plateau of Productivity: stable velocity, very corporate, high HHI, mature, global, influential, old peak
+    [0.0] * 24 + [0.20, 0.20, 0.15, 0.15, 0.10, 0.10, 0.10],
+])
+N_RULES = RULE_WEIGHTS.shape[1]
+
+# Phase names resolved once per process for rationale generation
+_PHASE_NAME: Dict[HypeCyclePhase, str] = {p: PhaseCharacteristics.PHASE_DEFINITIONS[p]["name"] for p in HypeCyclePhase}
+
+
+def _new_entrants_declining(new_entrants_by_year: Dict[int, int]) -> bool:
+    """Whether the last two years had fewer new assignees than the year before them"""
+    if not new_entrants_by_year:
+        return False
+
+    # PatentMetricsCalculator emits the years in order, which makes this sort a linear pass
+    recent_years = sorted(new_entrants_by_year)[-3:]
+    if len(recent_years) < 2:
+        return False
+
+    recent_entrants = new_entrants_by_year[recent_years[-2]] + new_entrants_by_year[recent_years[-1]]
+    earlier_entrants = new_entrants_by_year[recent_years[0]] if len(recent_years) > 2 else recent_entrants
+    return recent_entrants < earlier_entrants * 0.8
+
+
+@dataclass(frozen=True)
+class PatentScoringInputs:
+    """Scalar PatentMetricsSnapshot values the rules read; hashable, used as the score cache key"""
+
+    total_patents: int
+    velocity_trend: VelocityTrend
+    avg_patents_per_year: float
+    recent_velocity: float
+    years_since_peak: Optional[int]  # None without velocity data
+    peak_count: int
+    patents_last_year: int
+    avg_forward_citations: float
+    citation_ratio: float
+    unique_assignees_count: int
+    assignee_concentration_hhi: float
+    corporate_percentage: float
+    academic_percentage: float
+    new_entrants_declining: bool
+    unique_countries: int
+    technology_age_years: int
+
+    @classmethod
+    def from_metrics(cls, m: PatentMetricsSnapshot) -> "PatentScoringInputs":
+        """Extract the scoring inputs from a metrics snapshot (per-year dicts reduce to derived values)"""
+        return cls(
+            total_patents=m.total_patents,
+            velocity_trend=m.velocity_trend,
+            avg_patents_per_year=m.avg_patents_per_year,
+            recent_velocity=m.recent_velocity,
+            years_since_peak=m.years_since_peak if m.patent_velocity else None,
+            peak_count=m.peak_count,
+            patents_last_year=m.patents_last_year,
+            avg_forward_citations=m.avg_forward_citations,
+            citation_ratio=m.citation_ratio,
+            unique_assignees_count=m.unique_assignees_count,
+            assignee_concentration_hhi=m.assignee_concentration_hhi,
+            corporate_percentage=m.corporate_percentage,
+            academic_percentage=m.academic_percentage,
+            new_entrants_declining=_new_entrants_declining(m.new_entrants_by_year),
+            unique_countries=m.unique_countries,
+            technology_age_years=m.technology_age_years
+        )
+
+
+# Rule predicates in RULE_WEIGHTS column order; {threshold} fields are inlined per PatentRuleThresholds
+_RULE_FEATURES_SOURCE = """
+def rule_features(m):
+    years_since_peak = m.years_since_peak
+    has_peak = years_since_peak is not None
+
+    # Moderate concentration, shared by the Trough and Slope rules
+    hhi_moderate = {low_hhi!r} <= m.assignee_concentration_hhi <= {high_hhi!r}
+
+    return [
+        # Technology Trigger
+        m.total_patents < {low_patent_count!r},  # few patents total
+        m.academic_percentage > {high_academic_pct!r},  # research-driven
+        m.avg_forward_citations < 2,  # new patents not yet cited
+        m.technology_age_years < {young_technology_years!r},  # young technology
+        m.unique_assignees_count < 20,  # early entrants only
+        m.unique_countries < {low_country_spread!r},  # low geographic spread
+
+        # Peak of Inflated Expectations
+        has_peak and years_since_peak <= {recent_peak_years!r},  # at or near peak
+        m.velocity_trend in (VelocityTrend.INCREASING, VelocityTrend.PEAK_REACHED),
+        40 <= m.corporate_percentage <= 70,  # mixed corporate/academic (transition)
+        m.assignee_concentration_hhi < {low_hhi!r},  # many competitors entering
+        m.recent_velocity > m.avg_patents_per_year * 1.2,  # high recent activity
+        {low_country_spread!r} < m.unique_countries < {high_country_spread!r},  # growing number of countries
+
+        # Trough of Disillusionment
+        m.velocity_trend == VelocityTrend.DECREASING,
+        has_peak and 1 <= years_since_peak <= 5,  # recent peak, now declining
+        m.patents_last_year < m.peak_count * 0.6,  # recent patents well below peak
+        m.citation_ratio < {low_citation_ratio!r},  # patents cite more than they're cited
+        hhi_moderate,  # some consolidation
+        m.new_entrants_declining,
+
+        # Slope of Enlightenment
+        m.velocity_trend == VelocityTrend.STABLE,
+        70 <= m.corporate_percentage < 90,  # industry-led
+        has_peak and 4 <= years_since_peak <= 10,  # recovered from trough
+        hhi_moderate,  # established competitive landscape
+        m.unique_countries >= {low_country_spread!r},  # international adoption
+        0.3 <= m.citation_ratio <= 1.0,  # moderate citation ratio
+
+        # Plateau of Productivity
+        m.velocity_trend == VelocityTrend.STABLE,
+        m.corporate_percentage > 85,
+        m.assignee_concentration_hhi > {high_hhi!r},  # few dominant players
+        m.technology_age_years > {mature_technology_years!r},
+        m.unique_countries >= {high_country_spread!r},  # global adoption
+        m.citation_ratio > {high_citation_ratio!r},  # influential patents
+        has_peak and years_since_peak > 10,  # peak long ago
+    ]
+"""
+
+
+@lru_cache(maxsize=32)
+def _compile_rule_features(threshold_values: Tuple) -> Callable[[PatentScoringInputs], List[bool]]:
+    """
+    Compile the patent rule predicates specialized for one threshold set
+
+    Args:
+        threshold_values: PatentRuleThresholds field values (astuple), used as cache key
+
+    Returns:
+        Function mapping PatentScoringInputs to their rule outcomes
+    """
+    source = _RULE_FEATURES_SOURCE.format(**asdict(PatentRuleThresholds(*threshold_values)))
+    namespace = {"VelocityTrend": VelocityTrend}
+    exec(compile(source, "<patent_rule_features>", "exec"), namespace)
+    return namespace["rule_features"]
+
+
+@lru_cache(maxsize=1024)
+def _score_phases(threshold_values: Tuple, inputs: PatentScoringInputs) -> Tuple[float, ...]:
+    """
+    Score every phase for one set of scoring inputs, memoized
+
+    Thresholds are part of the key, so changing them never returns stale scores.
+
+    Args:
+        threshold_values: PatentRuleThresholds field values (astuple)
+        inputs: Scoring inputs extracted from a patent metrics snapshot
+
+    Returns:
+        Phase scores in PHASE_ORDER
+    """
+    features = np.array(_compile_rule_features(threshold_values)(inputs), dtype=np.float64)
+
+    # Each phase adds its weights rule by rule in column order (cumsum is strictly sequential),
+    # giving exactly the floats of adding each matched rule's weight in turn, so ties and the
+    # order of equal scores in the rationale are those of the original per-rule scoring
+    return tuple(np.minimum(np.cumsum(RULE_WEIGHTS * features, axis=1)[:, -1], 1.0).tolist())
 
-        # Peak was 4-10 years ago (recovered from trough)
-        if m.patent_velocity:
-            current_year = max(m.patent_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if 4 <= years_since_peak <= 10:
-                score += 0.20
 
-        # Moderate HHI (established competitive landscape)
-        if self.thresholds.low_hhi <= m.assignee_concentration_hhi <= self.thresholds.high_hhi:
-            score += 0.15
-
-        # Good geographic spread (international adoption)
-        if m.unique_countries >= self.thresholds.low_country_spread:
-            score += 0.1
-
-        # Moderate citation ratio
-        if 0.3 <= m.citation_ratio <= 1.0:
-            score += 0.1
-
-        return min(score, 1.0)
-
-    def _score_plateau(self, m: PatentMetricsSnapshot) -> float:
-        """
-        Score for Plateau of Productivity
-
-        Patent Indicators:
-        - Stable patent volume (plateau)
-        - Few large players dominate (high HHI)
-        - Very high corporate percentage (>85%)
-        - High forward citations on key patents
-        - Wide geographic spread
-        - Mature technology (>10 years)
-        - Mix of utility and design patents
-        """
-        score = 0.0
-
-        # Stable velocity (plateau)
-        if m.velocity_trend == "stable":
-            score += 0.20
-
-        # Very high corporate percentage
-        if m.corporate_percentage > 85:
-            score += 0.20
-
-        # High concentration (few dominant players)
-        if m.assignee_concentration_hhi > self.thresholds.high_hhi:
-            score += 0.15
-
-        # Mature technology
-        if m.technology_age_years > self.thresholds.mature_technology_years:
-            score += 0.15
-
-        # Wide geographic spread (global adoption)
-        if m.unique_countries >= self.thresholds.high_country_spread:
-            score += 0.1
-
-        # High citation ratio (influential patents)
-        if m.citation_ratio > self.thresholds.high_citation_ratio:
-            score += 0.1
-
-        # Peak was long ago (>10 years)
-        if m.patent_velocity:
-            current_year = max(m.patent_velocity.keys())
-            years_since_peak = current_year - m.peak_year
-            if years_since_peak > 10:
-                score += 0.1
+@dataclass
+class PatentRationale:
+    """
+    Human-readable explanation for a patent-based phase determination
 
-        return min(score, 1.0)
+    The text is only built when the rationale is converted with str(), so callers
+    that need just the phase and scores pay nothing for it.
+    """
 
-    def _generate_rationale(self, phase: HypeCyclePhase, metrics: PatentMetricsSnapshot,
-                           scores: Dict[HypeCyclePhase, float]) -> str:
-        """Generate human-readable explanation for patent-based phase determination"""
+    phase: HypeCyclePhase
+    metrics: PatentMetricsSnapshot
+    scores: Dict[HypeCyclePhase, float]
 
-        phase_info = PhaseCharacteristics.PHASE_DEFINITIONS[phase]
+    def __str__(self) -> str:
+        phase, metrics, scores = self.phase, self.metrics, self.scores
 
         rationale_parts = [
-            f"Patent-based Phase: {phase_info['name']}",
+            f"Patent-based Phase: {_PHASE_NAME[phase]}",
             f"Confidence score: {scores[phase]:.2f}",
             "",
             "Key patent indicators:",
@@ -354,7 +291,7 @@ class PatentHypeCycleRuleEngine:
                 f"- Corporate percentage: {metrics.corporate_percentage:.1f}% (industry-led)",
                 f"- HHI concentration: {metrics.assignee_concentration_hhi:.3f} (established players)",
                 f"- Geographic spread: {metrics.unique_countries} countries",
-                f"- Years since peak: {max(metrics.patent_velocity.keys()) - metrics.peak_year if metrics.patent_velocity else 'N/A'}"
+                f"- Years since peak: {metrics.years_since_peak if metrics.patent_velocity else 'N/A'}"
             ])
 
         elif phase == HypeCyclePhase.PLATEAU_PRODUCTIVITY:
@@ -375,9 +312,82 @@ class PatentHypeCycleRuleEngine:
         # Add comparison with other phases
         rationale_parts.append("")
         rationale_parts.append("Phase scores (patent-based):")
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        for p, s in sorted_scores:
-            phase_name = PhaseCharacteristics.PHASE_DEFINITIONS[p]["name"]
-            rationale_parts.append(f"  {phase_name}: {s:.2f}")
+        # Highest first; the sort is stable, so ties keep PHASE_ORDER
+        for p in sorted(scores, key=scores.get, reverse=True):
+            rationale_parts.append(f"  {_PHASE_NAME[p]}: {scores[p]:.2f}")
 
         return "\n".join(rationale_parts)
+
+
+class PatentHypeCycleRuleEngine:
+    """Rule-based engine for determining Hype Cycle phase from patent data"""
+
+    def __init__(self, thresholds: PatentRuleThresholds = None):
+        self.thresholds = thresholds or PatentRuleThresholds()
+        # Threshold values resolved once: the score cache key and the rule predicates compiled
+        # with these thresholds inlined as constants
+        self._threshold_values = astuple(self.thresholds)
+        self._rule_features = _compile_rule_features(self._threshold_values)
+
+    def determine_phase(self, metrics: PatentMetricsSnapshot) -> Tuple[HypeCyclePhase, float, Dict, PatentRationale]:
+        """
+        Determine Hype Cycle phase from patent metrics
+
+        Args:
+            metrics: Calculated patent metrics snapshot
+
+        Returns:
+            Tuple of (phase, confidence, rule_scores, rationale); str(rationale) gives the text
+        """
+        logger.info("Determining Hype Cycle phase from patent metrics...")
+
+        # All five phase scores from one product of the rule outcomes with the weight matrix,
+        # cached per (thresholds, scoring inputs) for repeated evaluations of the same technology.
+        # No phase is skipped: rule_scores and the rationale report every score
+        scores = _score_phases(self._threshold_values, PatentScoringInputs.from_metrics(metrics))
+        return self._phase_result(metrics, scores)
+
+    def determine_phases_batch(self, metrics_list: List[PatentMetricsSnapshot]) -> List[Tuple[HypeCyclePhase, float, Dict, PatentRationale]]:
+        """
+        Determine Hype Cycle phases for several patent metrics snapshots at once
+
+        All rule predicates are stacked into a (snapshots x rules) matrix and
+        scored against every phase with a single matrix product.
+
+        Args:
+            metrics_list: Calculated patent metrics snapshots
+
+        Returns:
+            List of (phase, confidence, rule_scores, rationale) tuples, one per snapshot
+        """
+        logger.info(f"Determining Hype Cycle phases from {len(metrics_list)} patent metrics snapshots...")
+
+        # Fill a preallocated (snapshots x rules) buffer row by row
+        features = np.empty((len(metrics_list), N_RULES), dtype=np.float64)
+        for row, m in enumerate(metrics_list):
+            features[row] = self._rule_features(PatentScoringInputs.from_metrics(m))
+
+        # Every phase is always scored: rule_scores reports all five, so there is no early exit.
+        # Weights are summed rule by rule in column order, exactly as _score_phases does
+        all_scores = np.minimum(np.cumsum(features[:, None, :] * RULE_WEIGHTS, axis=2)[:, :, -1], 1.0)
+
+        return [self._phase_result(m, scores) for m, scores in zip(metrics_list, all_scores.tolist())]
+
+    def _phase_result(self, metrics: PatentMetricsSnapshot,
+                      scores: List[float]) -> Tuple[HypeCyclePhase, float, Dict, PatentRationale]:
+        """Pick the best phase from the scores (in PHASE_ORDER) and package the determination"""
+        phase_scores = dict(zip(PHASE_ORDER, scores))
+
+        # Highest scoring phase (first in phase order on ties)
+        best_index = scores.index(max(scores))
+        best_phase = PHASE_ORDER[best_index]
+        confidence = scores[best_index]
+
+        logger.info(f"Patent phase determined: {best_phase.value} (confidence: {confidence:.2f})")
+
+        rationale = PatentRationale(best_phase, metrics, phase_scores)
+
+        # Convert enum keys to strings for JSON serialization
+        phase_scores_str = {phase.value: score for phase, score in phase_scores.items()}
+
+        return best_phase, confidence, phase_scores_str, rationale
@@ -1,12 +1,22 @@
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple, Optional
+from functools import cached_property
+from typing import Dict, Iterable, List, Tuple, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from collections import defaultdict, Counter
+from sqlalchemy.engine import Row
+from sqlalchemy import func, case, select
+from array import array
+from collections import Counter
 import numpy as np
+import ahocorasick
+import orjson
+import copy
+import time
 import logging
 
+from ..config import settings
 from ..models import Patent
+from .paper_metrics_calculator import VelocityTrend
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +27,7 @@ class PatentMetricsSnapshot:
     # Volume metrics
     total_patents: int
     patent_velocity: Dict[int, int]  # year -> count
-    velocity_trend: str  # "increasing", "decreasing", "stable", "peak_reached"
+    velocity_trend: VelocityTrend
     avg_patents_per_year: float
     peak_year: int
     peak_count: int
@@ -61,9 +71,77 @@ class PatentMetricsSnapshot:
     patents_with_abstract: int
     coverage_percentage: float
 
+    @cached_property
+    def current_year(self) -> int:
+        """Latest year with patents (0 if no velocity data)"""
+        return max(self.patent_velocity) if self.patent_velocity else 0
+
+    @cached_property
+    def years_since_peak(self) -> int:
+        """Years elapsed between the peak year and the latest patent year"""
+        return self.current_year - self.peak_year
+
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        data = asdict(self)
+        data["velocity_trend"] = str(self.velocity_trend)
+        return data
+
+
+@dataclass
+class PatentColumns:
+    """Per-patent values as parallel columns (one entry per patent, in year order)"""
+    years: np.ndarray  # int64, 0 when unknown
+    forward_citations: np.ndarray  # int64, 0 when unknown
+    backward_citations: np.ndarray  # int64, 0 when unknown
+    assignees: List[List[Dict]]  # parsed assignee objects, [] when missing
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Row]) -> "PatentColumns":
+        """Collect streamed (year, forward_citations, backward_citations, assignees_json) rows into columns"""
+        years = array("q")
+        forward_citations = array("q")
+        backward_citations = array("q")
+        assignees = []
+
+        for year, forward, backward, assignees_json in rows:
+            years.append(year or 0)
+            forward_citations.append(forward or 0)
+            backward_citations.append(backward or 0)
+            assignees.append(orjson.loads(assignees_json) if assignees_json else [])
+
+        return cls(
+            years=np.frombuffer(years, dtype=np.int64),
+            forward_citations=np.frombuffer(forward_citations, dtype=np.int64),
+            backward_citations=np.frombuffer(backward_citations, dtype=np.int64),
+            assignees=assignees
+        )
+
+    def __len__(self) -> int:
+        return len(self.assignees)
+
+
+# Last snapshot per technology: technology_id -> (cache key, monotonic time computed, snapshot).
+# The key (patent count, max patent id, max created_at) changes whenever patents are added or
+# removed; collected patents are never updated in place
+_snapshot_cache: Dict[int, Tuple[Tuple, float, PatentMetricsSnapshot]] = {}
+
+
+def _build_keyword_automaton(keywords: List[str]) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton matching any of the keywords as a substring
+
+    Args:
+        keywords: Lowercase keywords
+
+    Returns:
+        Automaton ready for iter()
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
 
 
 class PatentMetricsCalculator:
@@ -85,43 +163,66 @@ class PatentMetricsCalculator:
         "ag", "bv", "nv", "plc", "pty", "pvt", "srl", "spa"
     ]
 
+    # Academic keywords compiled once, matched in a single pass over an organization name
+    _ACADEMIC_AUTOMATON = _build_keyword_automaton(ACADEMIC_KEYWORDS)
+
     def __init__(self, db: Session):
         self.db = db
 
-    def calculate_metrics(self, technology_id: int) -> PatentMetricsSnapshot:
+    def calculate_metrics(self, technology_id: int, force: bool = False) -> PatentMetricsSnapshot:
         """
         Calculate all metrics for a technology's patents
 
         Args:
             technology_id: ID of technology to analyze
+            force: Recalculate even if a cached snapshot of the same patents exists
 
         Returns:
             PatentMetricsSnapshot with all calculated metrics
         """
         logger.info(f"Starting patent metrics calculation for technology {technology_id}")
 
-        # Fetch all patents for this technology
-        patents = self.db.query(Patent)\
-            .filter(Patent.technology_id == technology_id)\
-            .order_by(Patent.patent_year)\
-            .all()
+        # Reuse the last snapshot if the technology's patents have not changed since
+        cache_key = self._fetch_cache_key(technology_id)
+        if not force:
+            cached = self._get_cached_snapshot(technology_id, cache_key)
+            if cached is not None:
+                logger.info(f"Using cached patent metrics for technology {technology_id}")
+                return cached
+
+        # Per-year counts (and abstract coverage) are aggregated in the database
+        year_rows = self._fetch_year_aggregates(technology_id)
+        total_patents = sum(count for _, count, _ in year_rows)
 
-        if not patents:
+        if not total_patents:
             raise ValueError(f"No patents found for technology {technology_id}")
 
-        if len(patents) < 10:
-            raise ValueError(f"Insufficient patents for analysis. Found {len(patents)}, need at least 10.")
+        if total_patents < 10:
+            raise ValueError(f"Insufficient patents for analysis. Found {total_patents}, need at least 10.")
+
+        logger.info(f"Found {total_patents} patents to analyze")
 
-        logger.info(f"Found {len(patents)} patents to analyze")
+        # Citation and assignee metrics need per-patent values: stream only those columns.
+        # The rows are read-only, so they are fetched through Core, bypassing ORM result processing
+        stmt = select(
+            Patent.patent_year,
+            Patent.patent_num_times_cited_by_us_patents,
+            Patent.patent_num_us_patents_cited,
+            Patent._assignees
+        )\
+            .where(Patent.technology_id == technology_id)\
+            .order_by(Patent.patent_year)\
+            .execution_options(yield_per=2000)
+        rows = self.db.connection().execute(stmt)
+        patents = PatentColumns.from_rows(rows)
 
         # Calculate each metric category
-        volume_metrics = self._calculate_volume_metrics(patents)
+        volume_metrics = self._calculate_volume_metrics(year_rows, total_patents)
         citation_metrics = self._calculate_citation_metrics(patents)
-        assignee_metrics = self._calculate_assignee_metrics(patents)
-        geographic_metrics = self._calculate_geographic_metrics(patents)
-        type_metrics = self._calculate_type_metrics(patents)
-        temporal_metrics = self._calculate_temporal_metrics(patents)
-        quality_metrics = self._calculate_quality_metrics(patents)
+        assignee_metrics, geographic_metrics = self._calculate_assignee_and_geographic_metrics(patents)
+        type_metrics = self._calculate_type_metrics(self._fetch_type_counts(technology_id), total_patents)
+        temporal_metrics = self._calculate_temporal_metrics(year_rows)
+        quality_metrics = self._calculate_quality_metrics(year_rows, total_patents)
 
         # Combine into snapshot
         metrics = PatentMetricsSnapshot(
@@ -134,21 +235,105 @@ class PatentMetricsCalculator:
             **quality_metrics
         )
 
+        self._store_cached_snapshot(technology_id, cache_key, metrics)
+
         logger.info("Patent metrics calculation completed")
         return metrics
 
-    def _calculate_volume_metrics(self, patents: List[Patent]) -> Dict:
+    def _fetch_cache_key(self, technology_id: int) -> Tuple:
+        """
+        Fetch a cheap fingerprint of a technology's patents in one SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            Tuple of (patent_count, max_patent_id, max_created_at)
+        """
+        row = self.db.query(
+            func.count(Patent.id),
+            func.max(Patent.id),
+            func.max(Patent.created_at)
+        )\
+            .filter(Patent.technology_id == technology_id)\
+            .one()
+
+        return tuple(row)
+
+    def _get_cached_snapshot(self, technology_id: int, cache_key: Tuple) -> Optional[PatentMetricsSnapshot]:
+        """
+        Get a cached snapshot computed from the same patents within the TTL
+
+        The TTL bounds staleness of the metrics relative to the current year (e.g.
+        patents_last_2_years), which change even when the patents do not.
+
+        Returns:
+            A copy of the cached snapshot, or None
+        """
+        entry = _snapshot_cache.get(technology_id)
+        if entry is None:
+            return None
+
+        key, computed_at, snapshot = entry
+        if key != cache_key or time.monotonic() - computed_at > settings.hype_cycle_patent_metrics_cache_ttl_seconds:
+            return None
+
+        return copy.deepcopy(snapshot)
+
+    def _store_cached_snapshot(self, technology_id: int, cache_key: Tuple, snapshot: PatentMetricsSnapshot):
+        """Cache a freshly computed snapshot (a copy, so callers may modify theirs)"""
+        if settings.hype_cycle_patent_metrics_cache_ttl_seconds > 0:
+            _snapshot_cache[technology_id] = (cache_key, time.monotonic(), copy.deepcopy(snapshot))
+
+    def _fetch_year_aggregates(self, technology_id: int) -> List[Tuple[Optional[int], int, int]]:
+        """
+        Count patents per grant year in one grouped SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            List of (year, patent_count, with_abstract_count) tuples in year order;
+            patents without a year are grouped under None
+        """
+        has_abstract = func.coalesce(Patent.patent_abstract, "") != ""
+
+        rows = self.db.query(
+            Patent.patent_year,
+            func.count(Patent.id),
+            func.sum(case((has_abstract, 1), else_=0))
+        )\
+            .filter(Patent.technology_id == technology_id)\
+            .group_by(Patent.patent_year)\
+            .order_by(Patent.patent_year)\
+            .all()
+
+        return [tuple(row) for row in rows]
+
+    def _fetch_type_counts(self, technology_id: int) -> List[Tuple[Optional[str], int]]:
+        """
+        Count patents per patent type in one grouped SQL query
+
+        Args:
+            technology_id: ID of technology to analyze
+
+        Returns:
+            List of (patent_type, patent_count) tuples, types as stored
+        """
+        rows = self.db.query(Patent.patent_type, func.count(Patent.id))\
+            .filter(Patent.technology_id == technology_id)\
+            .group_by(Patent.patent_type)\
+            .all()
+
+        return [tuple(row) for row in rows]
+
+    def _calculate_volume_metrics(self, year_rows: List[Tuple], total_patents: int) -> Dict:
         """Calculate patent volume and velocity metrics"""
         logger.info("Calculating patent volume metrics...")
 
-        # Group by year
-        year_counts = defaultdict(int)
-        for patent in patents:
-            if patent.patent_year:
-                year_counts[patent.patent_year] += 1
-
-        # Sort years
-        sorted_years = sorted(year_counts.keys())
+        # Per-year counts, already grouped and ordered by year in SQL
+        year_counts = {year: count for year, count, _ in year_rows if year}
+        sorted_years = list(year_counts)
 
         if not sorted_years:
             raise ValueError("No patents with year information")
@@ -163,15 +348,15 @@ class PatentMetricsCalculator:
             earlier_3yr = sum(year_counts[y] for y in sorted_years[:3]) / 3
 
             if recent_3yr > earlier_3yr * 1.2:
-                trend = "increasing"
+                trend = VelocityTrend.INCREASING
             elif recent_3yr < earlier_3yr * 0.8:
-                trend = "decreasing"
+                trend = VelocityTrend.DECREASING
             elif peak_year in sorted_years[-3:]:
-                trend = "peak_reached"
+                trend = VelocityTrend.PEAK_REACHED
             else:
-                trend = "stable"
+                trend = VelocityTrend.STABLE
         else:
-            trend = "insufficient_data"
+            trend = VelocityTrend.INSUFFICIENT_DATA
 
         # Recent velocity (last 2 years)
         current_year = datetime.now().year
@@ -179,42 +364,38 @@ class PatentMetricsCalculator:
         recent_velocity = sum(year_counts[y] for y in recent_years) / max(len(recent_years), 1)
 
         return {
-            "total_patents": len(patents),
-            "patent_velocity": dict(year_counts),
+            "total_patents": total_patents,
+            "patent_velocity": year_counts,
             "velocity_trend": trend,
-            "avg_patents_per_year": len(patents) / max(len(sorted_years), 1),
+            "avg_patents_per_year": total_patents / max(len(sorted_years), 1),
             "peak_year": peak_year,
             "peak_count": peak_count,
             "recent_velocity": recent_velocity
         }
 
-    def _calculate_citation_metrics(self, patents: List[Patent]) -> Dict:
+    def _calculate_citation_metrics(self, patents: PatentColumns) -> Dict:
         """Calculate citation-based metrics"""
         logger.info("Calculating patent citation metrics...")
 
-        forward_citations = [
-            p.patent_num_times_cited_by_us_patents or 0
-            for p in patents
-        ]
-        backward_citations = [
-            p.patent_num_us_patents_cited or 0
-            for p in patents
-        ]
+        # Citation counts as packed arrays (0 when unknown), reduced in NumPy
+        count = len(patents)
+        forward_citations = patents.forward_citations
+        backward_citations = patents.backward_citations
 
-        total_forward = sum(forward_citations)
-        total_backward = sum(backward_citations)
-        avg_forward = total_forward / len(patents)
-        avg_backward = total_backward / len(patents)
+        total_forward = int(forward_citations.sum())
+        total_backward = int(backward_citations.sum())
+        avg_forward = total_forward / count
+        avg_backward = total_backward / count
 
         # Citation ratio (forward/backward)
         citation_ratio = total_forward / max(total_backward, 1)
 
-        # Median forward citations
-        median_forward = float(np.median(forward_citations))
+        # Median and 90th percentile from one partitioning pass over the forward citations
+        median_forward, percentile_90 = np.percentile(forward_citations, (50, 90)).tolist()
 
         # Highly cited threshold (top 10% or 50+ citations)
-        threshold = max(50, np.percentile(forward_citations, 90)) if forward_citations else 50
-        highly_cited = sum(1 for c in forward_citations if c >= threshold)
+        threshold = max(50, percentile_90)
+        highly_cited = int(np.count_nonzero(forward_citations >= threshold))
 
         return {
             "total_forward_citations": total_forward,
@@ -226,26 +407,38 @@ class PatentMetricsCalculator:
             "highly_cited_count": highly_cited
         }
 
-    def _calculate_assignee_metrics(self, patents: List[Patent]) -> Dict:
-        """Calculate assignee-related metrics including HHI concentration"""
-        logger.info("Calculating patent assignee metrics...")
+    def _calculate_assignee_and_geographic_metrics(self, patents: PatentColumns) -> Tuple[Dict, Dict]:
+        """
+        Calculate assignee metrics (including HHI concentration) and geographic metrics
+
+        Both are read from the same assignee lists, so they are collected in one pass.
+
+        Args:
+            patents: Patent columns
+
+        Returns:
+            Tuple of (assignee_metrics, geographic_metrics)
+        """
+        logger.info("Calculating patent assignee and geographic metrics...")
 
         # Extract all assignees from patents
         assignee_counts = Counter()
         assignee_types = {"corporate": 0, "academic": 0, "individual": 0}
         assignee_first_year = {}  # track when each assignee first appears
+        country_counts = Counter()
 
-        for patent in patents:
-            assignees = patent.assignees or []
-            patent_year = patent.patent_year
-
+        for patent_year, assignees in zip(patents.years.tolist(), patents.assignees):
             for assignee in assignees:
+                # Countries are counted for every assignee, named or not
+                country = assignee.get("assignee_country")
+                if country:
+                    country_counts[country] += 1
+
                 # Extract assignee name
                 name = assignee.get("assignee_organization") or assignee.get("assignee_individual_name_first", "")
                 if not name:
                     continue
 
-                name_lower = name.lower()
                 assignee_counts[name] += 1
 
                 # Track first appearance year
@@ -276,22 +469,27 @@ class PatentMetricsCalculator:
         else:
             corporate_pct = academic_pct = individual_pct = 0.0
 
-        # New entrants by year
-        new_entrants_by_year = defaultdict(int)
-        for assignee, first_year in assignee_first_year.items():
-            if first_year:
-                new_entrants_by_year[first_year] += 1
+        # New entrants by year, in year order (first years are only recorded when known)
+        new_entrants_by_year = dict(sorted(Counter(assignee_first_year.values()).items()))
 
-        return {
+        assignee_metrics = {
             "unique_assignees_count": unique_assignees,
             "top_assignees": top_assignees,
             "assignee_concentration_hhi": hhi,
             "corporate_percentage": corporate_pct,
             "academic_percentage": academic_pct,
             "individual_percentage": individual_pct,
-            "new_entrants_by_year": dict(new_entrants_by_year)
+            "new_entrants_by_year": new_entrants_by_year
+        }
+
+        geographic_metrics = {
+            "country_distribution": dict(country_counts),
+            "unique_countries": len(country_counts),
+            "top_countries": country_counts.most_common(10)
         }
 
+        return assignee_metrics, geographic_metrics
+
     def _classify_assignee_type(self, assignee: Dict) -> str:
         """
         Classify an assignee as corporate, academic, or individual
@@ -311,14 +509,11 @@ class PatentMetricsCalculator:
             return "individual"
 
         # Check for academic keywords
-        if any(kw in org_name for kw in self.ACADEMIC_KEYWORDS):
+        if next(self._ACADEMIC_AUTOMATON.iter(org_name), None) is not None:
             return "academic"
 
-        # Check for corporate keywords
-        if any(kw in org_name for kw in self.CORPORATE_KEYWORDS):
-            return "corporate"
-
-        # Default: if has organization name, assume corporate
+        # Any other organization is corporate, whether or not it contains one of the
+        # CORPORATE_KEYWORDS, so those need no scan
         if org_name:
             return "corporate"
 
@@ -340,46 +535,24 @@ class PatentMetricsCalculator:
         Returns:
             HHI value between 0 and 1
         """
-        total = sum(assignee_counts.values())
+        counts = np.fromiter(assignee_counts.values(), dtype=np.float64, count=len(assignee_counts))
+        total = counts.sum()
         if total == 0:
             return 0.0
 
-        hhi = sum((count / total) ** 2 for count in assignee_counts.values())
+        # Sum of squared counts over squared total: one division instead of one per assignee
+        hhi = float((counts * counts).sum() / (total * total))
         return hhi
 
-    def _calculate_geographic_metrics(self, patents: List[Patent]) -> Dict:
-        """Calculate geographic distribution metrics"""
-        logger.info("Calculating patent geographic metrics...")
-
-        country_counts = Counter()
-
-        for patent in patents:
-            assignees = patent.assignees or []
-            for assignee in assignees:
-                country = assignee.get("assignee_country")
-                if country:
-                    country_counts[country] += 1
-
-        unique_countries = len(country_counts)
-        top_countries = country_counts.most_common(10)
-
-        return {
-            "country_distribution": dict(country_counts),
-            "unique_countries": unique_countries,
-            "top_countries": top_countries
-        }
-
-    def _calculate_type_metrics(self, patents: List[Patent]) -> Dict:
+    def _calculate_type_metrics(self, type_rows: List[Tuple], total: int) -> Dict:
         """Calculate patent type distribution metrics"""
         logger.info("Calculating patent type metrics...")
 
+        # Types grouped as stored in SQL; merge case variants ("Utility", "utility")
         type_counts = Counter()
+        for patent_type, count in type_rows:
+            type_counts[(patent_type or "unknown").lower()] += count
 
-        for patent in patents:
-            patent_type = (patent.patent_type or "unknown").lower()
-            type_counts[patent_type] += 1
-
-        total = len(patents)
         utility_pct = (type_counts.get("utility", 0) / total) * 100
         design_pct = (type_counts.get("design", 0) / total) * 100
         other_pct = 100 - utility_pct - design_pct
@@ -390,16 +563,16 @@ class PatentMetricsCalculator:
             "other_type_percentage": other_pct
         }
 
-    def _calculate_temporal_metrics(self, patents: List[Patent]) -> Dict:
+    def _calculate_temporal_metrics(self, year_rows: List[Tuple]) -> Dict:
         """Calculate time-based metrics"""
         logger.info("Calculating patent temporal metrics...")
 
         current_year = datetime.now().year
 
-        # Get all years
-        years = [p.patent_year for p in patents if p.patent_year]
+        # One (year, count) pair per grant year, in year order (see _fetch_year_aggregates)
+        year_counts = [(year, count) for year, count, _ in year_rows if year]
 
-        if not years:
+        if not year_counts:
             return {
                 "first_patent_year": 0,
                 "technology_age_years": 0,
@@ -407,11 +580,11 @@ class PatentMetricsCalculator:
                 "patents_last_2_years": 0
             }
 
-        first_year = min(years)
+        first_year = year_counts[0][0]
         technology_age = current_year - first_year
 
-        patents_last_year = sum(1 for p in patents if p.patent_year == current_year - 1)
-        patents_last_2_years = sum(1 for p in patents if p.patent_year and p.patent_year >= current_year - 2)
+        patents_last_year = sum(count for year, count in year_counts if year == current_year - 1)
+        patents_last_2_years = sum(count for year, count in year_counts if year >= current_year - 2)
 
         return {
             "first_patent_year": first_year,
@@ -420,12 +593,11 @@ class PatentMetricsCalculator:
             "patents_last_2_years": patents_last_2_years
         }
 
-    def _calculate_quality_metrics(self, patents: List[Patent]) -> Dict:
+    def _calculate_quality_metrics(self, year_rows: List[Tuple], total: int) -> Dict:
         """Calculate data quality metrics"""
         logger.info("Calculating patent data quality metrics...")
 
-        total = len(patents)
-        with_abstract = sum(1 for p in patents if p.patent_abstract)
+        with_abstract = sum(abstract_count for _, _, abstract_count in year_rows)
         coverage = (with_abstract / total) * 100
 
         return {
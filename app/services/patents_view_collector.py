@@ -2,10 +2,13 @@ import httpx
 import logging
 import asyncio
 import json
+import orjson
+import time
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..config import settings
 from ..models import Technology, Patent
@@ -27,14 +30,14 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.tokens = max_requests
-        self.last_update = datetime.now()
+        self.last_update = time.monotonic()  # same clock as the event loop; immune to wall-clock jumps
         self.lock = asyncio.Lock()
 
     async def acquire(self):
         """Acquire a token, wait if necessary"""
         async with self.lock:
-            now = datetime.now()
-            elapsed = (now - self.last_update).total_seconds()
+            now = time.monotonic()
+            elapsed = now - self.last_update
 
             # Refill tokens based on elapsed time
             self.tokens = min(
@@ -168,59 +171,87 @@ class PatentsViewCollector:
             "errors": []
         }
 
-        # Cursor pagination
-        cursor = None
-        batch_count = 0
+        # Cursor pagination: each request needs the previous page's cursor, so pages are fetched
+        # in order, but the next page is requested while the previous one is being saved
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:  # Collect all patents
-                try:
+        async def fetch_batches(client: httpx.AsyncClient):
+            """Producer: put fetched batches (None on API error, or the exception raised) on the queue"""
+            cursor = None
+            try:
+                while True:
                     # Apply rate limiting
                     await self.rate_limiter.acquire()
 
-                    # Fetch batch
                     result = await self._fetch_batch(
                         client=client,
                         query=query,
                         cursor=cursor
                     )
+                    await queue.put(result)
 
-                    if result is None:
-                        break  # API error, stop collection
+                    if result is None or not result[2]:
+                        return  # API error or last page
+                    cursor = result[2]
 
-                    total, patents, next_cursor = result
-
-                    # First batch - record total
-                    if batch_count == 0:
-                        stats["total_patents_found"] = total
-                        logger.info(f"Total patents found: {total}")
-
-                    # Save patents to database
-                    new_count, duplicate_count = self._save_patents(
-                        patents=patents,
-                        technology_id=technology_id
-                    )
+            except Exception as e:
+                await queue.put(e)
 
-                    stats["new_patents"] += new_count
-                    stats["duplicate_patents"] += duplicate_count
-                    stats["patents_collected"] += len(patents)
-                    stats["batches_processed"] += 1
-                    batch_count += 1
+        batch_count = 0
+        loop = asyncio.get_running_loop()
 
-                    logger.info(f"Batch {batch_count}: {len(patents)} patents, {new_count} new, {duplicate_count} duplicates")
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            fetcher = asyncio.create_task(fetch_batches(client))
 
-                    # Check if more data available
-                    if not next_cursor:
-                        logger.info("No more data available")
+            try:
+                while True:  # Collect all patents
+                    try:
+                        result = await queue.get()
+                        if isinstance(result, Exception):
+                            raise result
+
+                        if result is None:
+                            break  # API error, stop collection
+
+                        total, patents, next_cursor = result
+
+                        # First batch - record total
+                        if batch_count == 0:
+                            stats["total_patents_found"] = total
+                            logger.info(f"Total patents found: {total}")
+
+                        # Save patents in thread pool to avoid blocking event loop
+                        # (the session is only used by one thread at a time: the call is awaited)
+                        new_count, duplicate_count = await loop.run_in_executor(
+                            None,
+                            self._save_patents,
+                            patents,
+                            technology_id
+                        )
+
+                        stats["new_patents"] += new_count
+                        stats["duplicate_patents"] += duplicate_count
+                        stats["patents_collected"] += len(patents)
+                        stats["batches_processed"] += 1
+                        batch_count += 1
+
+                        logger.info(f"Batch {batch_count}: {len(patents)} patents, {new_count} new, {duplicate_count} duplicates")
+
+                        # Check if more data available
+                        if not next_cursor:
+                            logger.info("No more data available")
+                            break
+
+                    except Exception as e:
+                        error_msg = f"Error in batch {batch_count + 1}: {str(e)}"
+                        logger.error(error_msg)
+                        stats["errors"].append(error_msg)
                         break
 
-                    cursor = next_cursor
-
-                except Exception as e:
-                    error_msg = f"Error in batch {batch_count + 1}: {str(e)}"
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
-                    break
+            finally:
+                # Stop a fetch still in flight after an error, before the client closes
+                fetcher.cancel()
+                await asyncio.gather(fetcher, return_exceptions=True)
 
         logger.info(f"Collection completed: {stats['new_patents']} new patents, {stats['duplicate_patents']} duplicates")
         return stats
@@ -278,7 +309,7 @@ class PatentsViewCollector:
             response = await client.post(url, json=payload, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Extract cursor for next page from last record
             patents = data.get("patents", [])
@@ -323,38 +354,73 @@ class PatentsViewCollector:
         Returns:
             Tuple of (new_count, duplicate_count)
         """
-        new_count = 0
-        duplicate_count = 0
-
+        rows = []
+        seen_ids = set()
+        missing_id_count = 0
         for patent_data in patents:
-            try:
-                patent = Patent(
-                    technology_id=technology_id,
-                    patent_id=patent_data.get("patent_id"),
-                    patent_title=patent_data.get("patent_title", ""),
-                    patent_abstract=patent_data.get("patent_abstract"),
-                    patent_date=patent_data.get("patent_date"),
-                    patent_year=patent_data.get("patent_year"),
-                    patent_type=patent_data.get("patent_type"),
-                    patent_num_us_patents_cited=patent_data.get("patent_num_us_patents_cited", 0),
-                    patent_num_times_cited_by_us_patents=patent_data.get("patent_num_times_cited_by_us_patents", 0)
-                )
-
-                # Handle assignees (complex field using property)
-                patent.assignees = patent_data.get("assignees", [])
-
-                self.db.add(patent)
-                self.db.commit()
-                new_count += 1
-
-            except IntegrityError:
-                # Duplicate patent (violates unique constraint)
-                self.db.rollback()
-                duplicate_count += 1
-                logger.debug(f"Duplicate patent skipped: {patent_data.get('patent_id')}")
+            # Skip records without an ID and repeats within the batch
+            patent_id = patent_data.get("patent_id")
+            if not patent_id:
+                logger.error(f"Patent without patent_id skipped: {patent_data.get('patent_title')}")
+                missing_id_count += 1
+                continue
+            if patent_id in seen_ids:
+                continue
+            seen_ids.add(patent_id)
+
+            assignees = patent_data.get("assignees")
+            rows.append({
+                "technology_id": technology_id,
+                "patent_id": patent_id,
+                "patent_title": patent_data.get("patent_title") or "",
+                "patent_abstract": patent_data.get("patent_abstract"),
+                "patent_date": patent_data.get("patent_date"),
+                "patent_year": patent_data.get("patent_year"),
+                "patent_type": patent_data.get("patent_type"),
+                "patent_num_us_patents_cited": patent_data.get("patent_num_us_patents_cited", 0),
+                "patent_num_times_cited_by_us_patents": patent_data.get("patent_num_times_cited_by_us_patents", 0),
+                # Assignees stored as JSON, as the Patent.assignees property does
+                "_assignees": json.dumps(assignees) if assignees else None
+            })
 
-            except Exception as e:
-                self.db.rollback()
-                logger.error(f"Error saving patent {patent_data.get('patent_id')}: {str(e)}")
+        if not rows:
+            return 0, 0
+
+        failed_count = 0
+        try:
+            new_count = self._insert_patents(rows)
+        except Exception as e:
+            # One bad row fails the whole statement: retry row by row so only that row is lost
+            self.db.rollback()
+            logger.warning(f"Bulk insert of {len(rows)} patents failed, retrying one by one: {str(e)}")
+            new_count = 0
+            for row in rows:
+                try:
+                    new_count += self._insert_patents([row])
+                except Exception as e:
+                    self.db.rollback()
+                    failed_count += 1
+                    logger.error(f"Error saving patent {row['patent_id']}: {str(e)}")
+
+        # Intra-batch repeats plus rows already stored
+        duplicate_count = len(patents) - missing_id_count - new_count - failed_count
 
         return new_count, duplicate_count
+
+    def _insert_patents(self, rows: List[Dict]) -> int:
+        """
+        Insert patent rows in one statement and commit
+
+        Duplicates (unique technology_id + patent_id) are skipped by the database.
+
+        Returns:
+            Number of rows inserted
+        """
+        insert = pg_insert if self.db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(Patent).values(rows).on_conflict_do_nothing(
+            index_elements=["technology_id", "patent_id"]
+        )
+
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,89 @@
+"""
+Database migration script to store news article IDs as raw BLAKE2b digests.
+
+Articles collected earlier carry a hex article_id (bare MD5, or "b2:"-prefixed
+BLAKE2b). This script recomputes the raw 16-byte ID from the stored URL so
+duplicate detection keeps working across old and new collections; rows whose
+URL was already re-collected under the new ID are removed as duplicates.
+
+Supports SQLite and PostgreSQL. On PostgreSQL a VARCHAR article_id column is
+first converted to BYTEA (legacy hex IDs are kept as their text bytes until
+they are recomputed below); other databases are rejected:
+python migrate_news_article_ids.py
+"""
+
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.services.news_collector import NewsCollector
+
+# Rows still carrying a legacy hex ID, per database dialect
+LEGACY_ROWS_QUERY = {
+    "sqlite": "SELECT id, technology_id, url FROM news_articles WHERE typeof(article_id) != 'blob'",
+    # Legacy IDs are 32 (MD5) or 35 ("b2:" + BLAKE2b) characters, new IDs 16 raw bytes
+    "postgresql": "SELECT id, technology_id, url FROM news_articles WHERE octet_length(article_id) != 16",
+}
+
+
+def _convert_postgresql_column(db):
+    """Change a VARCHAR article_id column to BYTEA, keeping each legacy ID as its text bytes"""
+    column_type = db.execute(text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'news_articles' AND column_name = 'article_id'"
+    )).scalar()
+
+    if column_type != "bytea":
+        db.execute(text(
+            "ALTER TABLE news_articles ALTER COLUMN article_id TYPE BYTEA "
+            "USING convert_to(article_id, 'UTF8')"
+        ))
+        print(f"[OK] Colonna article_id convertita da {column_type} a bytea.")
+
+
+def migrate_article_ids():
+    """Convert legacy hex article IDs to raw BLAKE2b digests"""
+    print("Migrating news article IDs...")
+
+    db = SessionLocal()
+    try:
+        dialect = db.bind.dialect.name
+        if dialect not in LEGACY_ROWS_QUERY:
+            raise RuntimeError(f"Unsupported database '{dialect}': only sqlite and postgresql are supported")
+
+        if dialect == "postgresql":
+            _convert_postgresql_column(db)
+
+        collector = NewsCollector(db)
+        legacy_rows = db.execute(text(LEGACY_ROWS_QUERY[dialect])).all()
+
+        updated = 0
+        removed = 0
+        for row_id, technology_id, url in legacy_rows:
+            article_id = collector._generate_article_id({"url": url})
+            existing = db.execute(
+                text("SELECT 1 FROM news_articles WHERE technology_id = :tech AND article_id = :aid"),
+                {"tech": technology_id, "aid": article_id}
+            ).first()
+
+            if existing:
+                db.execute(text("DELETE FROM news_articles WHERE id = :id"), {"id": row_id})
+                removed += 1
+            else:
+                db.execute(
+                    text("UPDATE news_articles SET article_id = :aid WHERE id = :id"),
+                    {"aid": article_id, "id": row_id}
+                )
+                updated += 1
+
+        db.commit()
+        print(f"[OK] {updated} article ID aggiornati, {removed} duplicati rimossi.")
+
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Errore durante la migrazione degli article ID: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate_article_ids()
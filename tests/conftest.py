@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 (registers the tables on Base.metadata)
+from app.database import Base
+from app.models import Technology
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def technology(db):
+    """A stored technology to attach collected data to"""
+    tech = Technology(name="Plant Cell Culture")
+    tech.keywords = ["plant cell culture"]
+    db.add(tech)
+    db.commit()
+    return tech
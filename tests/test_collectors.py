@@ -0,0 +1,105 @@
+"""Bulk inserts of collected articles and patents"""
+import hashlib
+
+from app.models import NewsArticle, Patent
+from app.schemas.news_article import NewsArticleResponse
+from app.services.news_collector import NewsCollector
+from app.services.patents_view_collector import PatentsViewCollector
+
+
+def make_article(n, **overrides):
+    article = {
+        "title": f"Article {n}",
+        "description": "Plant cell culture news",
+        "content": "Content",
+        "url": f"https://example.com/{n}",
+        "urlToImage": None,
+        "publishedAt": "2025-01-02T03:04:05Z",
+        "author": "Reporter",
+        "source": {"id": None, "name": "Example"},
+    }
+    article.update(overrides)
+    return article
+
+
+def make_patent(n, **overrides):
+    patent = {
+        "patent_id": f"{10000000 + n}",
+        "patent_title": f"Patent {n}",
+        "patent_abstract": "Abstract",
+        "patent_date": "2020-05-06",
+        "patent_year": 2020,
+        "patent_type": "utility",
+        "patent_num_us_patents_cited": 3,
+        "patent_num_times_cited_by_us_patents": 1,
+        "assignees": [{"assignee_organization": "Acme Corp"}],
+    }
+    patent.update(overrides)
+    return patent
+
+
+def test_article_id_is_blake2b_digest_of_url(db):
+    article = make_article(1)
+
+    article_id = NewsCollector(db)._generate_article_id(article)
+
+    assert article_id == hashlib.blake2b(article["url"].encode(), digest_size=16).digest()
+    assert len(article_id) == 16
+
+
+def test_save_articles_skips_repeats_within_batch_and_stored_rows(db, technology):
+    collector = NewsCollector(db)
+
+    # The reprint repeats article 1's URL
+    first = [make_article(1), make_article(2), make_article(1, title="Reprint")]
+    assert collector._save_articles(first, technology.id) == (2, 1)
+
+    second = [make_article(2), make_article(3)]
+    assert collector._save_articles(second, technology.id) == (1, 1)
+
+    stored = db.query(NewsArticle).order_by(NewsArticle.id).all()
+    assert [a.title for a in stored] == ["Article 1", "Article 2", "Article 3"]
+    assert stored[0].source == {"id": None, "name": "Example"}
+
+
+def test_save_articles_keeps_good_rows_when_one_row_fails(db, technology):
+    collector = NewsCollector(db)
+
+    # A dict cannot be bound as a published_at value, failing the bulk statement
+    articles = [make_article(1), make_article(2, publishedAt={"bad": "value"}), make_article(3)]
+
+    assert collector._save_articles(articles, technology.id) == (2, 0)
+    assert sorted(a.title for a in db.query(NewsArticle)) == ["Article 1", "Article 3"]
+
+
+def test_save_patents_skips_missing_ids_and_duplicates(db, technology):
+    collector = PatentsViewCollector(db)
+
+    first = [make_patent(1), make_patent(2), make_patent(1), make_patent(3, patent_id=None)]
+    assert collector._save_patents(first, technology.id) == (2, 1)
+
+    second = [make_patent(2), make_patent(4)]
+    assert collector._save_patents(second, technology.id) == (1, 1)
+
+    stored = db.query(Patent).order_by(Patent.id).all()
+    assert [p.patent_title for p in stored] == ["Patent 1", "Patent 2", "Patent 4"]
+    assert stored[0].assignees == [{"assignee_organization": "Acme Corp"}]
+
+
+def test_save_patents_keeps_good_rows_when_one_row_fails(db, technology):
+    collector = PatentsViewCollector(db)
+
+    patents = [make_patent(1), make_patent(2, patent_year={"bad": "value"}), make_patent(3)]
+
+    assert collector._save_patents(patents, technology.id) == (2, 0)
+    assert sorted(p.patent_title for p in db.query(Patent)) == ["Patent 1", "Patent 3"]
+
+
+def test_article_response_exposes_article_id_as_hex(db, technology):
+    NewsCollector(db)._save_articles([make_article(1)], technology.id)
+    article = db.query(NewsArticle).one()
+
+    response = NewsArticleResponse.model_validate(article)
+
+    assert response.article_id == article.article_id.hex()
+    assert NewsArticleResponse.model_validate({**response.model_dump(), "article_id": "abc"}).article_id == "abc"
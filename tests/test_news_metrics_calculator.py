@@ -0,0 +1,156 @@
+"""News metrics: tokenizer fast path, date parsing, source names and snapshot cache"""
+import random
+import string
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.models import NewsArticle
+from app.services import news_metrics_calculator
+from app.services.news_collector import NewsCollector
+from app.services.news_metrics_calculator import NewsMetricsCalculator, _TOKEN_RE, _tokenize
+
+
+@pytest.fixture
+def snapshot_cache(monkeypatch):
+    """Empty snapshot cache, enabled with the default TTL"""
+    cache = {}
+    monkeypatch.setattr(news_metrics_calculator, "_snapshot_cache", cache)
+    monkeypatch.setattr(settings, "hype_cycle_news_metrics_cache_ttl_seconds", 86400)
+    return cache
+
+
+def save_articles(db, technology, sources, start=0):
+    """Store one article per source (a dict or None), published on consecutive days"""
+    articles = [
+        {
+            "title": f"Cell culture breakthrough {n}",
+            "description": "Researchers report scalable bioreactors",
+            "content": "Plant cells grown in bioreactors",
+            "url": f"https://example.com/{n}",
+            "publishedAt": f"2025-01-{n % 28 + 1:02d}T10:00:00Z",
+            "author": "Reporter" if n % 2 else None,
+            "source": source,
+        }
+        for n, source in enumerate(sources, start)
+    ]
+    NewsCollector(db)._save_articles(articles, technology.id)
+
+
+@pytest.mark.parametrize("text", [
+    "plant cell culture, bioreactor scale-up",
+    "it's a test: foo_bar x2ray cafe café ABCD abcd",
+    "one\ttwo\nthree  four-five",
+    "",
+])
+def test_tokenize_matches_regex(text):
+    assert _tokenize(text.lower()) == _TOKEN_RE.findall(text.lower())
+
+
+def test_tokenize_matches_regex_on_random_ascii():
+    rnd = random.Random(3)
+    alphabet = string.ascii_lowercase * 4 + string.digits + string.punctuation + " \t\n"
+    for _ in range(500):
+        text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 80)))
+        assert _tokenize(text) == _TOKEN_RE.findall(text)
+
+
+def test_parse_dates_matches_parse_date():
+    calculator = NewsMetricsCalculator(None)
+    date_strs = [
+        "2025-01-02T03:04:05Z",
+        "2025-01-02T03:04:05.5Z",
+        "2025-01-02T03:04:05.123456Z",
+        "2025-01-02T03:04:05+02:00",
+        "2025-01-02T03:04:05-05:00",
+        "2025-01-02",
+        None,
+        "",
+    ]
+
+    expected = [calculator._parse_date(s) for s in date_strs]
+    expected = np.array([dt.replace(tzinfo=None) for dt in expected if dt], dtype="datetime64[us]")
+
+    np.testing.assert_array_equal(calculator._parse_dates(date_strs), expected)
+    # A malformed date falls back to per-date parsing and is skipped
+    np.testing.assert_array_equal(calculator._parse_dates(date_strs + ["not a date"]), expected)
+
+
+def test_parse_dates_keeps_fractional_seconds():
+    calculator = NewsMetricsCalculator(None)
+
+    dates = calculator._parse_dates(["2025-01-02T03:04:05.999999Z", "2025-01-02T03:04:06Z"])
+
+    assert dates[0] < dates[1]
+    assert (dates[1] - dates[0]) == np.timedelta64(1, "us")
+
+
+def test_source_names_follow_source_get_name(db, technology):
+    sources = [
+        {"id": None, "name": "Example"},
+        None,
+        {"id": "wire"},
+        {"id": None, "name": None},
+        {"id": None, "name": ""},
+        {"id": None, "name": 7},
+    ]
+    save_articles(db, technology, sources)
+    calculator = NewsMetricsCalculator(db)
+
+    names = [name for _, name in db.query(NewsArticle.id, calculator._source_name_column()).order_by(NewsArticle.id)]
+
+    assert names == ["Example", "unknown", "unknown", None, "", "7"]
+
+
+def test_rank_values_accepts_mixed_names():
+    calculator = NewsMetricsCalculator(None)
+
+    names, counts = calculator._rank_values(["b", None, "a", "b", None, "b", ""])
+
+    assert names == ["b", None, "a", ""]
+    assert counts.tolist() == [3, 2, 1, 1]
+
+
+def test_metrics_top_sources(db, technology, snapshot_cache):
+    save_articles(db, technology, [{"name": "Example"}] * 6 + [None] * 3 + [{"name": None}] * 2)
+
+    metrics = NewsMetricsCalculator(db).calculate_metrics(technology.id)
+
+    assert metrics.top_sources[:3] == [("Example", 6), ("unknown", 3), (None, 2)]
+    assert metrics.unique_sources == 3
+
+
+def test_snapshot_cache_returns_copies(db, technology, snapshot_cache):
+    save_articles(db, technology, [{"name": "Example"}] * 12)
+    calculator = NewsMetricsCalculator(db)
+
+    first = calculator.calculate_metrics(technology.id)
+    first.top_sources.clear()
+    second = calculator.calculate_metrics(technology.id)
+
+    assert technology.id in snapshot_cache
+    assert second.top_sources == [("Example", 12)]
+    assert second is not first
+
+
+def test_snapshot_cache_invalidated_by_new_articles(db, technology, snapshot_cache):
+    save_articles(db, technology, [{"name": "Example"}] * 12)
+    calculator = NewsMetricsCalculator(db)
+    assert calculator.calculate_metrics(technology.id).total_articles == 12
+
+    save_articles(db, technology, [{"name": "Other"}], start=12)
+
+    assert calculator.calculate_metrics(technology.id).total_articles == 13
+
+
+def test_snapshot_cache_bypassed(db, technology, snapshot_cache, monkeypatch):
+    save_articles(db, technology, [{"name": "Example"}] * 12)
+    calculator = NewsMetricsCalculator(db)
+
+    calculator.calculate_metrics(technology.id, use_cache=False)
+    assert snapshot_cache == {}
+
+    monkeypatch.setattr(settings, "hype_cycle_news_metrics_cache_ttl_seconds", 0)
+    calculator.calculate_metrics(technology.id)
+    assert snapshot_cache == {}
@@ -0,0 +1,81 @@
+"""Patent metrics snapshot cache"""
+import pytest
+
+from app.config import settings
+from app.services import patent_metrics_calculator
+from app.services.patent_metrics_calculator import PatentMetricsCalculator
+from app.services.patents_view_collector import PatentsViewCollector
+
+
+@pytest.fixture
+def snapshot_cache(monkeypatch):
+    """Empty snapshot cache, enabled with the default TTL"""
+    cache = {}
+    monkeypatch.setattr(patent_metrics_calculator, "_snapshot_cache", cache)
+    monkeypatch.setattr(settings, "hype_cycle_patent_metrics_cache_ttl_seconds", 86400)
+    return cache
+
+
+def save_patents(db, technology, count, start=0):
+    """Store patents granted one per year, alternating academic and corporate assignees"""
+    patents = [
+        {
+            "patent_id": f"{10000000 + n}",
+            "patent_title": f"Patent {n}",
+            "patent_abstract": "Plant cell culture bioreactor",
+            "patent_date": f"{2005 + n}-05-06",
+            "patent_year": 2005 + n,
+            "patent_type": "utility",
+            "patent_num_us_patents_cited": 3,
+            "patent_num_times_cited_by_us_patents": n,
+            "assignees": [{
+                "assignee_organization": "State University" if n % 2 else "Acme Corp",
+                "assignee_country": "US",
+            }],
+        }
+        for n in range(start, start + count)
+    ]
+    PatentsViewCollector(db)._save_patents(patents, technology.id)
+
+
+def test_snapshot_cache_returns_copies(db, technology, snapshot_cache):
+    save_patents(db, technology, 12)
+    calculator = PatentMetricsCalculator(db)
+
+    first = calculator.calculate_metrics(technology.id)
+    first.patent_velocity.clear()
+    second = calculator.calculate_metrics(technology.id)
+
+    assert technology.id in snapshot_cache
+    assert second.total_patents == 12
+    assert len(second.patent_velocity) == 12
+
+
+def test_snapshot_cache_invalidated_by_new_patents(db, technology, snapshot_cache):
+    save_patents(db, technology, 12)
+    calculator = PatentMetricsCalculator(db)
+    assert calculator.calculate_metrics(technology.id).total_patents == 12
+
+    save_patents(db, technology, 1, start=12)
+
+    assert calculator.calculate_metrics(technology.id).total_patents == 13
+
+
+def test_snapshot_cache_disabled(db, technology, snapshot_cache, monkeypatch):
+    monkeypatch.setattr(settings, "hype_cycle_patent_metrics_cache_ttl_seconds", 0)
+    save_patents(db, technology, 12)
+
+    PatentMetricsCalculator(db).calculate_metrics(technology.id)
+
+    assert snapshot_cache == {}
+
+
+def test_force_recalculates(db, technology, snapshot_cache):
+    save_patents(db, technology, 12)
+    calculator = PatentMetricsCalculator(db)
+    calculator.calculate_metrics(technology.id)
+    _, computed_at, _ = snapshot_cache[technology.id]
+
+    calculator.calculate_metrics(technology.id, force=True)
+
+    assert snapshot_cache[technology.id][1] > computed_at
@@ -0,0 +1,372 @@
+"""
+Rule engines against the original per-rule scoring
+
+The reference functions below are the baseline rules: one `score += weight` per
+matched rule, in rule order, capped at 1.0. The engines compile the rules into
+predicates scored against a weight matrix and must give exactly the same floats.
+"""
+import random
+
+import pytest
+
+from app.models.hype_cycle_phase import HypeCyclePhase, PhaseCharacteristics
+from app.services.hype_cycle_rule_engine import HypeCycleRuleEngine, RuleThresholds
+from app.services.news_hype_cycle_rule_engine import NewsHypeCycleRuleEngine, NewsRuleThresholds
+from app.services.news_metrics_calculator import NewsMetricsSnapshot
+from app.services.paper_metrics_calculator import MetricsSnapshot, ResearchTypeTrend, VelocityTrend
+from app.services.patent_hype_cycle_rule_engine import PatentHypeCycleRuleEngine, PatentRuleThresholds
+from app.services.patent_metrics_calculator import PatentMetricsSnapshot
+
+PHASES = [
+    HypeCyclePhase.TECHNOLOGY_TRIGGER,
+    HypeCyclePhase.PEAK_INFLATED_EXPECTATIONS,
+    HypeCyclePhase.TROUGH_DISILLUSIONMENT,
+    HypeCyclePhase.SLOPE_ENLIGHTENMENT,
+    HypeCyclePhase.PLATEAU_PRODUCTIVITY,
+]
+
+PHASE_NAMES = {p: PhaseCharacteristics.PHASE_DEFINITIONS[p]["name"] for p in PHASES}
+
+TRENDS = ["increasing", "decreasing", "stable", "peak_reached", "insufficient_data"]
+
+
+def _sum_rules(rules):
+    """Add the weight of each matched (weight, matched) rule in turn, capped at 1.0"""
+    score = 0.0
+    for weight, matched in rules:
+        if matched:
+            score += weight
+    return min(score, 1.0)
+
+
+def _years_since_peak(velocity, peak_year):
+    return max(velocity.keys()) - peak_year if velocity else None
+
+
+def reference_paper_scores(m, t):
+    trend = str(m.velocity_trend)
+    since_peak = _years_since_peak(m.publication_velocity, m.peak_year)
+    years_span = len(m.publication_velocity)
+    recent_low = years_span > 0 and m.papers_last_2_years < (years_span * m.avg_papers_per_year / years_span) * 2
+    return [
+        _sum_rules([
+            (0.3, trend == "increasing" and m.growth_rate_early_vs_late > 50),
+            (0.25, m.basic_research_percentage > t.basic_research_high),
+            (0.2, m.avg_citations_per_paper < 20),
+            (0.15, m.academic_venue_percentage > 90),
+            (0.1, recent_low),
+        ]),
+        _sum_rules([
+            (0.3, since_peak is not None and since_peak <= t.peak_recency_years),
+            (0.25, m.citation_growth_rate > t.citation_growth_high),
+            (0.25, 40 <= m.applied_research_percentage <= 60 and str(m.research_type_trend) == "toward_applied"),
+            (0.2, trend in ["increasing", "peak_reached"]),
+        ]),
+        _sum_rules([
+            (0.35, trend == "decreasing"),
+            (0.3, since_peak is not None and 1 <= since_peak <= 3),
+            (0.2, m.citation_growth_rate < t.citation_growth_moderate),
+            (0.15, m.papers_last_year < m.peak_count * 0.7),
+        ]),
+        _sum_rules([
+            (0.3, t.applied_research_high <= m.applied_research_percentage < t.applied_research_very_high),
+            (0.25, trend in ["stable", "increasing"] and m.growth_rate_early_vs_late > 0),
+            (0.25, t.citation_growth_moderate <= m.citation_growth_rate < t.citation_growth_high),
+            (0.2, since_peak is not None and 4 <= since_peak <= 7),
+        ]),
+        _sum_rules([
+            (0.35, m.applied_research_percentage > t.applied_research_very_high),
+            (0.25, trend == "stable"),
+            (0.2, m.avg_citations_per_paper > 50),
+            (0.1, m.industry_venue_percentage > 30),
+            (0.1, since_peak is not None and since_peak >= 8),
+        ]),
+    ]
+
+
+def _new_entrants_declining(new_entrants_by_year):
+    if not new_entrants_by_year:
+        return False
+    recent_years = sorted(new_entrants_by_year.keys())[-3:]
+    if len(recent_years) < 2:
+        return False
+    recent = sum(new_entrants_by_year.get(y, 0) for y in recent_years[-2:])
+    earlier = sum(new_entrants_by_year.get(y, 0) for y in recent_years[:-2]) if len(recent_years) > 2 else recent
+    return recent < earlier * 0.8
+
+
+def reference_patent_scores(m, t):
+    trend = str(m.velocity_trend)
+    since_peak = _years_since_peak(m.patent_velocity, m.peak_year)
+    return [
+        _sum_rules([
+            (0.25, m.total_patents < t.low_patent_count),
+            (0.25, m.academic_percentage > t.high_academic_pct),
+            (0.15, m.avg_forward_citations < 2),
+            (0.15, m.technology_age_years < t.young_technology_years),
+            (0.1, m.unique_assignees_count < 20),
+            (0.1, m.unique_countries < t.low_country_spread),
+        ]),
+        _sum_rules([
+            (0.25, since_peak is not None and since_peak <= t.recent_peak_years),
+            (0.25, trend in ["increasing", "peak_reached"]),
+            (0.15, 40 <= m.corporate_percentage <= 70),
+            (0.15, m.assignee_concentration_hhi < t.low_hhi),
+            (0.1, m.recent_velocity > m.avg_patents_per_year * 1.2),
+            (0.1, t.low_country_spread < m.unique_countries < t.high_country_spread),
+        ]),
+        _sum_rules([
+            (0.30, trend == "decreasing"),
+            (0.25, since_peak is not None and 1 <= since_peak <= 5),
+            (0.15, m.patents_last_year < m.peak_count * 0.6),
+            (0.15, m.citation_ratio < t.low_citation_ratio),
+            (0.1, t.low_hhi <= m.assignee_concentration_hhi <= t.high_hhi),
+            (0.05, _new_entrants_declining(m.new_entrants_by_year)),
+        ]),
+        _sum_rules([
+            (0.25, trend == "stable"),
+            (0.20, 70 <= m.corporate_percentage < 90),
+            (0.20, since_peak is not None and 4 <= since_peak <= 10),
+            (0.15, t.low_hhi <= m.assignee_concentration_hhi <= t.high_hhi),
+            (0.1, m.unique_countries >= t.low_country_spread),
+            (0.1, 0.3 <= m.citation_ratio <= 1.0),
+        ]),
+        _sum_rules([
+            (0.20, trend == "stable"),
+            (0.20, m.corporate_percentage > 85),
+            (0.15, m.assignee_concentration_hhi > t.high_hhi),
+            (0.15, m.technology_age_years > t.mature_technology_years),
+            (0.1, m.unique_countries >= t.high_country_spread),
+            (0.1, m.citation_ratio > t.high_citation_ratio),
+            (0.1, since_peak is not None and since_peak > 10),
+        ]),
+    ]
+
+
+def reference_news_scores(m, t):
+    trend = str(m.velocity_trend)
+    return [
+        _sum_rules([
+            (0.30, m.total_articles < t.low_article_count),
+            (0.25, m.unique_sources < t.low_source_count),
+            (0.20, m.source_concentration_hhi > t.high_hhi),
+            (0.15, m.unique_authors < 20),
+            (0.10, m.articles_without_author_percentage > 40),
+        ]),
+        _sum_rules([
+            (0.30, trend in ["increasing", "peak_reached"]),
+            (0.20, m.unique_sources > t.low_source_count),
+            (0.20, m.source_concentration_hhi < t.low_hhi),
+            (0.15, m.recent_velocity > m.avg_articles_per_month * 1.2),
+            (0.15, len(m.emerging_keywords) > 5),
+        ]),
+        _sum_rules([
+            (0.35, trend == "decreasing"),
+            (0.25, m.growth_rate_early_vs_late < t.decline_threshold),
+            (0.20, m.articles_last_3_months < m.articles_first_3_months * 0.5),
+            (0.10, len(m.declining_keywords) > len(m.emerging_keywords)),
+            (0.10, m.source_concentration_hhi > t.low_hhi),
+        ]),
+        _sum_rules([
+            (0.30, trend == "stable"),
+            (0.25, t.low_source_count <= m.unique_sources <= t.high_source_count),
+            (0.20, t.low_hhi <= m.source_concentration_hhi <= t.high_hhi),
+            (0.15, len(m.emerging_keywords) > 0 and len(m.declining_keywords) > 0),
+            (0.10, m.coverage_percentage > 60),
+        ]),
+        _sum_rules([
+            (0.25, m.total_articles > t.high_article_count),
+            (0.25, trend == "stable"),
+            (0.20, m.unique_sources > t.high_source_count),
+            (0.15, m.source_concentration_hhi < t.low_hhi),
+            (0.15, m.coverage_percentage > 70),
+        ]),
+    ]
+
+
+def paper_snapshots(n=500):
+    rnd = random.Random(42)
+    for _ in range(n):
+        years = sorted(rnd.sample(range(2000, 2026), rnd.randint(0, 12)))
+        yield MetricsSnapshot(
+            publication_velocity={y: rnd.randint(1, 300) for y in years},
+            velocity_trend=VelocityTrend[rnd.choice(TRENDS).upper()],
+            avg_papers_per_year=rnd.uniform(0, 200),
+            peak_year=rnd.choice(years) if years else 2010,
+            peak_count=rnd.randint(0, 300),
+            recent_velocity=rnd.uniform(0, 100),
+            total_citations=rnd.randint(0, 10000),
+            avg_citations_per_paper=rnd.choice([rnd.uniform(0, 100), 20, 50]),
+            median_citations=rnd.uniform(0, 50),
+            citation_growth_rate=rnd.choice([rnd.uniform(-50, 80), 10.0, 30.0]),
+            highly_cited_count=rnd.randint(0, 50),
+            basic_research_percentage=rnd.choice([rnd.uniform(0, 100), 70.0]),
+            applied_research_percentage=rnd.choice([rnd.uniform(0, 100), 40.0, 60.0, 80.0]),
+            mixed_research_percentage=rnd.uniform(0, 100),
+            research_type_trend=ResearchTypeTrend[rnd.choice(["toward_applied", "toward_basic", "stable"]).upper()],
+            top_keywords=[("cell", 10)],
+            emerging_keywords=[],
+            declining_keywords=[],
+            academic_venue_percentage=rnd.choice([rnd.uniform(0, 100), 90.0]),
+            industry_venue_percentage=rnd.choice([rnd.uniform(0, 100), 30.0]),
+            conference_percentage=0.0,
+            journal_percentage=100.0,
+            papers_last_year=rnd.randint(0, 300),
+            papers_last_2_years=rnd.randint(0, 600),
+            papers_first_2_years=rnd.randint(0, 50),
+            growth_rate_early_vs_late=rnd.choice([rnd.uniform(-100, 200), 0.0, 50.0]),
+            papers_with_abstracts=0,
+            papers_with_pdf=0,
+            coverage_percentage=0.0,
+        )
+
+
+def patent_snapshots(n=500):
+    rnd = random.Random(11)
+    for _ in range(n):
+        years = sorted(rnd.sample(range(1995, 2026), rnd.choice([0, 1, 2, 3, 5, 12, 25])))
+        velocity = {y: rnd.randint(1, 80) for y in years}
+        peak_year = max(velocity, key=velocity.get) if velocity else 0
+        if velocity and rnd.random() < 0.3:
+            peak_year = max(years) - rnd.choice([0, 1, 3, 4, 5, 10, 11])
+        avg = rnd.uniform(1, 60)
+        yield PatentMetricsSnapshot(
+            total_patents=rnd.choice([rnd.randint(1, 900), 50, 500]),
+            patent_velocity=velocity,
+            velocity_trend=VelocityTrend[rnd.choice(TRENDS).upper()],
+            avg_patents_per_year=avg,
+            peak_year=peak_year,
+            peak_count=rnd.randint(0, 100),
+            recent_velocity=rnd.choice([rnd.uniform(0, 100), avg * 1.2]),
+            total_forward_citations=rnd.randint(0, 1000),
+            total_backward_citations=rnd.randint(0, 1000),
+            avg_forward_citations=rnd.choice([rnd.uniform(0, 10), 2.0]),
+            avg_backward_citations=rnd.uniform(0, 10),
+            citation_ratio=rnd.choice([rnd.uniform(0, 3), 0.3, 1.0]),
+            median_forward_citations=1.0,
+            highly_cited_count=rnd.randint(0, 10),
+            unique_assignees_count=rnd.choice([rnd.randint(0, 60), 20]),
+            top_assignees=[(f"Assignee {j}", 30 - j) for j in range(rnd.randint(0, 8))],
+            assignee_concentration_hhi=rnd.choice([rnd.uniform(0, 0.6), 0.1, 0.25]),
+            corporate_percentage=rnd.choice([rnd.uniform(0, 100), 40.0, 70.0, 85.0, 90.0]),
+            academic_percentage=rnd.choice([rnd.uniform(0, 100), 50.0]),
+            individual_percentage=rnd.uniform(0, 20),
+            new_entrants_by_year={y: rnd.randint(0, 15) for y in rnd.sample(range(1995, 2026), rnd.choice([0, 1, 2, 3, 4, 8]))},
+            country_distribution={"US": 3},
+            unique_countries=rnd.choice([rnd.randint(0, 40), 5, 20]),
+            top_countries=[("US", 3)],
+            utility_percentage=rnd.uniform(0, 100),
+            design_percentage=rnd.uniform(0, 30),
+            other_type_percentage=rnd.uniform(0, 10),
+            first_patent_year=min(years) if years else 0,
+            technology_age_years=rnd.choice([rnd.randint(0, 30), 5, 15]),
+            patents_last_year=rnd.randint(0, 80),
+            patents_last_2_years=rnd.randint(0, 160),
+            patents_with_abstract=rnd.randint(0, 100),
+            coverage_percentage=rnd.uniform(0, 100),
+        )
+
+
+def news_snapshots(n=500):
+    rnd = random.Random(7)
+    for _ in range(n):
+        avg = rnd.uniform(1, 100)
+        yield NewsMetricsSnapshot(
+            total_articles=rnd.choice([rnd.randint(10, 600), 30, 300]),
+            article_velocity={"2025-01": 3},
+            velocity_trend=rnd.choice(TRENDS),
+            avg_articles_per_month=avg,
+            peak_month="2025-01",
+            peak_count=rnd.randint(1, 100),
+            recent_velocity=rnd.choice([rnd.uniform(0, 150), avg * 1.2]),
+            unique_sources=rnd.choice([rnd.randint(1, 40), 5, 20]),
+            top_sources=[(f"S{j}", 10 - j) for j in range(rnd.randint(0, 8))],
+            source_concentration_hhi=rnd.choice([rnd.uniform(0, 0.5), 0.1, 0.25]),
+            unique_authors=rnd.choice([rnd.randint(0, 60), 20]),
+            top_authors=[("A", 3)],
+            articles_without_author_percentage=rnd.choice([rnd.uniform(0, 100), 40.0]),
+            top_keywords=[("cell", 10)],
+            emerging_keywords=[f"e{j}" for j in range(rnd.randint(0, 10))],
+            declining_keywords=[f"d{j}" for j in range(rnd.randint(0, 10))],
+            first_article_date="2024-01-01",
+            articles_last_month=rnd.randint(0, 50),
+            articles_last_3_months=rnd.randint(0, 100),
+            articles_first_3_months=rnd.choice([rnd.randint(0, 100), 0]),
+            growth_rate_early_vs_late=rnd.choice([rnd.uniform(-100, 200), -20.0]),
+            articles_with_content=5,
+            articles_with_description=5,
+            coverage_percentage=rnd.choice([rnd.uniform(0, 100), 60.0, 70.0]),
+        )
+
+
+def assert_matches_reference(result, reference_scores):
+    """Check a (phase, confidence, rule_scores, rationale) result against reference scores"""
+    phase, confidence, rule_scores, rationale = result
+    expected = dict(zip(PHASES, reference_scores))
+    best_phase = max(expected, key=expected.get)
+
+    assert rule_scores == {p.value: s for p, s in expected.items()}
+    assert phase == best_phase
+    assert confidence == expected[best_phase]
+
+    # Phase scores are listed highest first, equal scores in phase order
+    lines = str(rationale).splitlines()
+    header = max(i for i, line in enumerate(lines) if line.startswith("Phase scores"))
+    ranked = sorted(expected.items(), key=lambda x: x[1], reverse=True)
+    assert lines[header + 1:] == [f"  {PHASE_NAMES[p]}: {s:.2f}" for p, s in ranked]
+
+
+@pytest.mark.parametrize("thresholds", [
+    RuleThresholds(),
+    RuleThresholds(basic_research_high=50.0, peak_recency_years=1, citation_growth_moderate=5.0),
+])
+def test_paper_engine_matches_reference_rules(thresholds):
+    engine = HypeCycleRuleEngine(thresholds)
+    snapshots = list(paper_snapshots())
+    batch = engine.determine_phases_batch(snapshots)
+
+    for m, batch_result in zip(snapshots, batch):
+        reference = reference_paper_scores(m, thresholds)
+        assert_matches_reference(engine.determine_phase(m), reference)
+        assert_matches_reference(batch_result, reference)
+
+
+@pytest.mark.parametrize("thresholds", [
+    PatentRuleThresholds(),
+    PatentRuleThresholds(low_patent_count=100, low_hhi=0.05, recent_peak_years=2,
+                         low_country_spread=3, mature_technology_years=10),
+])
+def test_patent_engine_matches_reference_rules(thresholds):
+    engine = PatentHypeCycleRuleEngine(thresholds)
+    snapshots = list(patent_snapshots())
+    batch = engine.determine_phases_batch(snapshots)
+
+    for m, batch_result in zip(snapshots, batch):
+        reference = reference_patent_scores(m, thresholds)
+        assert_matches_reference(engine.determine_phase(m), reference)
+        assert_matches_reference(batch_result, reference)
+
+
+@pytest.mark.parametrize("thresholds", [
+    NewsRuleThresholds(),
+    NewsRuleThresholds(low_article_count=100, low_source_count=10, low_hhi=0.05),
+])
+def test_news_engine_matches_reference_rules(thresholds):
+    engine = NewsHypeCycleRuleEngine(thresholds)
+
+    for m in news_snapshots():
+        assert_matches_reference(engine.determine_phase(m), reference_news_scores(m, thresholds))
+
+
+def test_engines_with_different_thresholds_do_not_share_predicates():
+    m = next(news_snapshots())
+    m.total_articles = 50
+
+    default_scores = NewsHypeCycleRuleEngine().determine_phase(m)[2]
+    strict_scores = NewsHypeCycleRuleEngine(NewsRuleThresholds(low_article_count=100)).determine_phase(m)[2]
+
+    assert default_scores != strict_scores
+    assert strict_scores == dict(zip(
+        [p.value for p in PHASES],
+        reference_news_scores(m, NewsRuleThresholds(low_article_count=100))
+    ))